@@ -1,3 +1,7 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -12,11 +16,115 @@ from app.routes.nft import router as nft_router
 from app.models.base import engine, Base
 from app.utils import web3_helper, chain_config
 
+
+ALEMBIC_INI_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini")
+
+# Advisory lock key serializing migrations across workers ("utl_migr" as ASCII)
+MIGRATION_LOCK_KEY = 0x75746C5F6D696772
+
+
+# Database setup
+def _run_migrations() -> None:
+    """
+    Upgrade the database to the latest Alembic revision.
+
+    With several workers every lifespan gets here at once. On PostgreSQL the
+    upgrade is serialized with a session-level advisory lock, so the first
+    worker migrates and the others find the database already at head.
+    """
+    from alembic import command
+    from alembic.config import Config as AlembicConfig
+
+    alembic_cfg = AlembicConfig(ALEMBIC_INI_PATH)
+    alembic_cfg.set_main_option("script_location", os.path.join(os.path.dirname(ALEMBIC_INI_PATH), "migrations"))
+    alembic_cfg.attributes["configure_logger"] = False
+
+    if engine.dialect.name != "postgresql":
+        command.upgrade(alembic_cfg, "head")
+        return
+
+    with engine.connect() as lock_connection:
+        lock_connection.exec_driver_sql(f"SELECT pg_advisory_lock({MIGRATION_LOCK_KEY})")
+        try:
+            command.upgrade(alembic_cfg, "head")
+        finally:
+            lock_connection.exec_driver_sql(f"SELECT pg_advisory_unlock({MIGRATION_LOCK_KEY})")
+            lock_connection.commit()
+
+
+def _warm_db_pool() -> None:
+    """Open the pool's connections up front so the first requests don't pay the handshake."""
+    pool_size = engine.pool.size() if hasattr(engine.pool, "size") else 0
+    connections = [engine.connect() for _ in range(pool_size)]
+    for connection in connections:
+        connection.close()
+    logger.info(f"Database connection pool warmed with {pool_size} connections")
+
+
+async def _prepare_database(app: FastAPI) -> None:
+    """Run migrations (unless skipped), create missing tables and warm the pool."""
+    app.state.migration_status = "running"
+    try:
+        if Config.MIGRATION_MODE != "skip":
+            await asyncio.to_thread(_run_migrations)
+            logger.info("Database migrations applied")
+
+        # Initialize database and create tables if needed
+        await asyncio.to_thread(Base.metadata.create_all, bind=engine)
+        logger.info("Database tables created or confirmed to exist")
+        await asyncio.to_thread(_warm_db_pool)
+    except Exception as e:
+        app.state.migration_status = "failed"
+        logger.error(f"Database setup failed: {e}", exc_info=True)
+        return
+    app.state.migration_status = "done"
+
+
+# Startup and shutdown
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize service on startup and clean up on shutdown."""
+    # Logger is already configured when imported
+    
+    # Load chain configuration
+    chain_config.load_chain_configs()
+    
+    # Load contract ABIs and bytecode
+    contract_data_loaded = web3_helper.load_contract_data()
+    if not contract_data_loaded:
+        logger.error("Failed to load required contract artifacts. Service cannot continue without artifacts.")
+        # Force exit with error since we can't operate without contract artifacts
+        import sys
+        sys.exit(1)
+    
+    # Prepare the database; in async mode health checks are served meanwhile
+    # and /health/ready reports 503 until it finishes
+    migration_task = None
+    if Config.MIGRATION_MODE == "async":
+        migration_task = asyncio.create_task(_prepare_database(app))
+    else:
+        await _prepare_database(app)
+        if app.state.migration_status == "failed":
+            import sys
+            sys.exit(1)
+    
+    # Startup message
+    logger.info(f"Universal Token Contract Deployment Service started in {Config.ENVIRONMENT} environment")
+
+    yield
+
+    logger.info(f"{Config.APP_NAME} shutting down")
+    if migration_task and not migration_task.done():
+        migration_task.cancel()
+    engine.dispose()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Universal Token Contract Deployment Service",
     description="API for deploying and managing universal tokens across multiple blockchains",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -100,41 +208,23 @@ async def health_check():
     """Health check endpoint for Docker."""
     return {"status": "healthy"}
 
+# Readiness probe: healthy only once the database has been prepared
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness check endpoint; 503 until migrations have finished."""
+    migration_status = getattr(app.state, "migration_status", "pending")
+    if migration_status != "done":
+        return JSONResponse(
+            status_code=503,
+            content={"status": "not_ready", "migration_status": migration_status}
+        )
+    return {"status": "ready", "migration_status": migration_status}
+
 # Include routers
 app.include_router(deployment_router)
 app.include_router(users_router)
 app.include_router(nft_router)
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Initialize service on startup."""
-    # Logger is already configured when imported
-    
-    # Load chain configuration
-    chain_config.load_chain_configs()
-    
-    # Load contract ABIs and bytecode
-    contract_data_loaded = web3_helper.load_contract_data()
-    if not contract_data_loaded:
-        logger.error("Failed to load required contract artifacts. Service cannot continue without artifacts.")
-        # Force exit with error since we can't operate without contract artifacts
-        import sys
-        sys.exit(1)
-    
-    # Initialize database and create tables if needed
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables created or confirmed to exist")
-    
-    # Startup message
-    logger.info(f"Universal Token Contract Deployment Service started in {Config.ENVIRONMENT} environment")
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Clean up resources on application shutdown."""
-    logger.info(f"{Config.APP_NAME} shutting down")
-
 if __name__ == "__main__":
     """
     Main entry point for the application.
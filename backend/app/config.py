@@ -15,6 +15,7 @@ class Config:
     # Server settings
     PORT = int(os.getenv("PORT", "8000"))
     HOST = os.getenv("HOST", "0.0.0.0")
+    WORKERS = int(os.getenv("WORKERS", "1"))
     
     # Database settings
     DB_USERNAME = os.getenv("DB_USERNAME", "postgres")
@@ -26,9 +27,15 @@ class Config:
         f"postgresql://{DB_USERNAME}:{DB_PASSWORD}@"
         f"{DB_HOST}:{DB_PORT}/{DB_DATABASE}"
     )
+    # Set when DB_HOST points at PgBouncer in transaction pooling mode
+    DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() == "true"
+    # Alembic upgrade at startup: "sync" (before serving), "async" (in the background) or "skip"
+    MIGRATION_MODE = os.getenv("MIGRATION_MODE", "skip").lower()
     
     # Blockchain settings
     DEPLOYER_PRIVATE_KEY = os.getenv("DEPLOYER_PRIVATE_KEY", "")
+    # Maximum in-flight requests per RPC host; further calls wait for a free connection
+    RPC_MAX_CONCURRENCY = int(os.getenv("RPC_MAX_CONCURRENCY", "5"))
     ZETA_CHAIN_ID = "7001"  # ZetaChain Testnet
     
     # Universal Token settings
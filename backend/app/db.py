@@ -1,19 +1,25 @@
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import NullPool, QueuePool
 
 from app.config import Config
 
 # Create SQLAlchemy engine with connection pooling
-engine = create_engine(
-    Config.DB_URL,
-    poolclass=QueuePool,
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=1800,
-)
+if Config.DB_PGBOUNCER:
+    # PgBouncer owns the pool; holding server connections here as well
+    # would defeat transaction pooling
+    engine = create_engine(Config.DB_URL, poolclass=NullPool)
+else:
+    engine = create_engine(
+        Config.DB_URL,
+        poolclass=QueuePool,
+        pool_size=5,
+        max_overflow=10,
+        pool_timeout=30,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+    )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
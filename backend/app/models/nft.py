@@ -16,7 +16,7 @@ class NFTCollectionModel(Base):
     
     __tablename__ = "nft_deployments"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     collection_name = Column(String, nullable=False)
     collection_symbol = Column(String, nullable=False)
     base_uri = Column(String, nullable=False)
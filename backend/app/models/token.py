@@ -2,7 +2,7 @@
 
 import re
 from typing import Dict, List, Optional, Any
-from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, Boolean
+from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, Boolean, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -16,7 +16,7 @@ class TokenModel(Base):
     
     __tablename__ = "token_deployments"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     token_name = Column(String, nullable=False)
     token_symbol = Column(String, nullable=False)
     decimals = Column(Integer, nullable=False, default=18)
@@ -62,6 +62,18 @@ class TokenModel(Base):
         }
 
 
+# Newest-first ordering index used when listing or pruning deployments
+Index(
+    'ix_token_deployments_created_at_id',
+    TokenModel.created_at.desc(),
+    TokenModel.id.desc()
+)
+
+# Case-insensitive address lookups; queries must compare func.lower(column) to match them
+Index('ix_token_deployments_zc_contract_address_lower', func.lower(TokenModel.zc_contract_address))
+Index('ix_token_deployments_deployer_address_lower', func.lower(TokenModel.deployer_address))
+
+
 # Pydantic Schemas
 class TokenAllocation(BaseModel):
     """Schema for token allocation to an address."""
@@ -168,56 +168,46 @@ async def deploy_token(token_data: TokenSchema, db: Session = Depends(get_db)):
             success_bool = True
 
         # Automatically trigger verification for all successfully deployed contracts
-        verification_results = []
+        verification_targets = []  # (chain label, contract to verify)
         
         # Verify ZetaChain contract if it was deployed successfully
         if db_deployment.zc_contract_address and final_status_summary["zetaChain"].get("status") == "completed":
             logger.info(f"Automatically verifying ZetaChain contract: {db_deployment.zc_contract_address}")
-            try:
-                zc_verification = await verification_service.verify_contract(
-                    contract_address=db_deployment.zc_contract_address,
-                    chain_id=db_deployment.testnet and "7001" or "7000",  # Use correct chain ID based on testnet flag
-                    contract_type="zetachain",
-                    db=db
-                )
-                verification_results.append({
-                    "chain": "ZetaChain",
-                    "status": zc_verification.get("status", "unknown"),
-                    "message": zc_verification.get("message", "")
-                })
-                logger.info(f"ZetaChain verification result: {zc_verification.get('status')}")
-            except Exception as e:
-                logger.error(f"Error triggering verification for ZetaChain contract: {e}")
+            verification_targets.append(("ZetaChain", {
+                "contract_address": db_deployment.zc_contract_address,
+                "chain_id": db_deployment.testnet and "7001" or "7000",  # Use correct chain ID based on testnet flag
+                "contract_type": "zetachain"
+            }))
         
         # Verify EVM contracts if they were deployed successfully
         for chain_id, chain_info in connected_chains_data.items():
             if chain_info.get("contract_address") and chain_info.get("setup_status") == "completed":
                 logger.info(f"Automatically verifying EVM contract on chain {chain_id}: {chain_info['contract_address']}")
-                try:
-                    # Create constructor args for EVM contracts
-                    contract_args = {
-                        "name": db_deployment.token_name,
-                        "symbol": db_deployment.token_symbol,
-                        "decimals": db_deployment.decimals,
-                        "supply": 0,  # EVM tokens have 0 initial supply
-                        "owner": db_deployment.deployer_address
-                    }
-                    
-                    evm_verification = await verification_service.verify_contract(
-                        contract_address=chain_info["contract_address"],
-                        chain_id=chain_id,
-                        contract_type="evm",
-                        contract_args=contract_args,
-                        db=db
-                    )
-                    verification_results.append({
-                        "chain": chain_id,
-                        "status": evm_verification.get("status", "unknown"),
-                        "message": evm_verification.get("message", "")
-                    })
-                    logger.info(f"Chain {chain_id} verification result: {evm_verification.get('status')}")
-                except Exception as e:
-                    logger.error(f"Error triggering verification for chain {chain_id}: {e}")
+                verification_targets.append((chain_id, {
+                    "contract_address": chain_info["contract_address"],
+                    "chain_id": chain_id,
+                    "contract_type": "evm"
+                }))
+        
+        # Submit and poll all verifications concurrently; a failure on one chain doesn't abort the others
+        verification_results = []
+        if verification_targets:
+            try:
+                outcomes = await verification_service.verify_contracts(
+                    [contract for _, contract in verification_targets],
+                    db=db
+                )
+            except Exception as e:
+                logger.error(f"Error triggering contract verification: {e}")
+                outcomes = []
+            
+            for (chain, _), outcome in zip(verification_targets, outcomes):
+                verification_results.append({
+                    "chain": chain,
+                    "status": outcome.get("status", "unknown"),
+                    "message": outcome.get("message", "")
+                })
+                logger.info(f"{chain} verification result: {outcome.get('status')}")
         
         # Update verification status from results
         if verification_results:
@@ -1,6 +1,7 @@
 """User routes for retrieving user information."""
 
 from fastapi import APIRouter, Depends, HTTPException, status, Path
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 import re
 
@@ -170,7 +171,7 @@ async def get_user_tokens(
                 user_tokens.append(user_token)
         
         # Find tokens where the user is the deployer but may not have a balance
-        deployer_filter = TokenModel.deployer_address.ilike(address.lower())
+        deployer_filter = func.lower(TokenModel.deployer_address) == address.lower()
         deployed_tokens = db.query(TokenModel).filter(deployer_filter).all()
         
         # Add tokens where the user is the deployer but not already processed
@@ -1,5 +1,7 @@
 """Deployment service for universal token contracts."""
 
+import asyncio
+
 from sqlalchemy.orm import Session
 from typing import Dict, List, Any
 
@@ -10,6 +12,7 @@ from app.utils.web3_helper import (
     get_account, 
     get_zrc20_address,
     call_contract_method,
+    abi_function_names,
     UNIVERSAL_TOKEN_ABI,
     UNIVERSAL_TOKEN_BYTECODE,
     ZC_UNIVERSAL_TOKEN_ABI,
@@ -19,12 +22,22 @@ from app.utils.web3_helper import (
     deploy_implementation,
     deploy_erc1967_proxy,
     encode_initialize_data,
+    fetch_tx_params,
+    sign_raw_call,
     get_chain_config
 )
 from web3 import Web3
 from sqlalchemy.orm.attributes import flag_modified
 from app.config import Config
 
+TRANSFER_TYPES = ["address", "uint256"]
+SELECTOR_TRANSFER = bytes.fromhex("a9059cbb")  # transfer(address,uint256)
+if __debug__:
+    assert Web3.keccak(text=f"transfer({','.join(TRANSFER_TYPES)})")[:4] == SELECTOR_TRANSFER
+
+# Allocation receipts waited on at once; each wait occupies a default-executor thread
+RECEIPT_WAIT_CONCURRENCY = 4
+
 
 class DeploymentService:
     """Service for deploying standard universal token contracts using UUPS Proxies."""
@@ -228,15 +241,16 @@ class DeploymentService:
                             3000000,  # gas
                             uniswap_router_address  # uniswapRouterAddress
                         ],
-                        gas_limit=8000000 if zeta_chain_id_str == "7000" else 5000000
+                        gas_limit=8000000 if zeta_chain_id_str == "7000" else 5000000,
+                        skip_estimate=True
                     )
                     
                     if init_result.get("success"):
                         logger.info("✅ Direct initialize call succeeded!")
                         
                         # Verify router address was set correctly
-                        zc_contract = zc_web3.eth.contract(address=zc_proxy_address, abi=ZC_UNIVERSAL_TOKEN_ABI)
-                        if hasattr(zc_contract.functions, 'uniswapRouter'):
+                        if 'uniswapRouter' in abi_function_names(ZC_UNIVERSAL_TOKEN_ABI):
+                            zc_contract = zc_web3.eth.contract(address=zc_proxy_address, abi=ZC_UNIVERSAL_TOKEN_ABI)
                             router_address = zc_contract.functions.uniswapRouter().call()
                             logger.info(f"ZetaChain contract uniswapRouter value: {router_address}")
                             if router_address.lower() != uniswap_router_address.lower():
@@ -292,7 +306,8 @@ class DeploymentService:
                 contract_abi=ZC_UNIVERSAL_TOKEN_ABI,
                 method_name="mint",
                 args=[service_account.address, total_supply_wei],
-                gas_limit=1000000
+                gas_limit=1000000,
+                skip_estimate=True
             )
             
             if not mint_result.get("success"):
@@ -307,103 +322,52 @@ class DeploymentService:
             logger.warning("Continuing deployment without initial supply")
 
         # --- Step 2: Deploy to EVM Chains (Standard Impl + Proxy + Initialize) ---
+        # Each chain is independent and IO-bound on its own RPC, so deploy them
+        # concurrently; each runs on its own thread/event loop since the web3 calls block.
         deployed_evm_proxies = {} # Store {chain_id_str: proxy_address}
-        for chain_id_str in selected_chains:
-            if chain_id_str == zeta_chain_id_str:
-                continue
-
-            logger.info(f"Deploying standard implementation and proxy to EVM chain {chain_id_str}...")
-            evm_proxy_address = None
-            evm_impl_address = None
-            numeric_chain_id = -1
+        evm_chain_ids = [cid for cid in selected_chains if cid != zeta_chain_id_str]
 
+        async def deploy_evm_chain(chain_id_str: str):
             try:
-                numeric_chain_id = int(chain_id_str)
-                evm_web3 = await get_web3(numeric_chain_id)
-                if not evm_web3:
-                    raise ConnectionError(f"Failed to connect to EVM chain {chain_id_str}")
-
-                # 2a. Deploy implementation contract
-                logger.info(f"Deploying EVM implementation contract on chain {chain_id_str}...")
-                
-                impl_deploy_result = await deploy_implementation(
-                    web3=evm_web3,
-                    account=service_account,
-                    contract_abi=UNIVERSAL_TOKEN_ABI,
-                    contract_bytecode=UNIVERSAL_TOKEN_BYTECODE,
-                    constructor_args=None,
-                    gas_limit_override=5000000
+                outcome = await asyncio.to_thread(
+                    asyncio.run,
+                    self._deploy_evm_chain(chain_id_str, token_config, service_account)
                 )
-                
-                if not impl_deploy_result.get("success"):
-                    raise ValueError(f"EVM implementation deployment failed: {impl_deploy_result.get('message')}")
-                
-                evm_impl_address = impl_deploy_result.get("contract_address")
+            except Exception as e:
+                logger.error(f"EVM deploy/init exception on {chain_id_str}: {e}")
+                outcome = {
+                    "status": "failed",
+                    "implementation_address": None,
+                    "proxy_address": None,
+                    "message": f"EVM deploy/init exception on {chain_id_str}: {e}"
+                }
+            return chain_id_str, outcome
+
+        # Record each chain as soon as it finishes so the deployment status
+        # shows progress instead of waiting on the slowest chain
+        for next_chain in asyncio.as_completed([deploy_evm_chain(cid) for cid in evm_chain_ids]):
+            chain_id_str, outcome = await next_chain
+            evm_impl_address = outcome.get("implementation_address")
+            evm_proxy_address = outcome.get("proxy_address")
+            if not deployment.connected_chains_json: deployment.connected_chains_json = {}
+            chain_json = deployment.connected_chains_json.setdefault(chain_id_str, {})
+            deployment_result["evmChains"][chain_id_str]["status"] = outcome["status"]
+            chain_json["status"] = outcome["status"]
+            if evm_impl_address:
                 deployment_result["evmChains"][chain_id_str]["implementation_address"] = evm_impl_address
-                if not deployment.connected_chains_json: deployment.connected_chains_json = {}
-                if chain_id_str not in deployment.connected_chains_json: deployment.connected_chains_json[chain_id_str] = {}
-                deployment.connected_chains_json[chain_id_str]["implementation_address"] = evm_impl_address
-                flag_modified(deployment, "connected_chains_json")
-                logger.info(f"EVM implementation deployed for {chain_id_str}: {evm_impl_address}")
-
-                # 2b. Prepare initialization data for EVM token
-                chain_config = Config.get_chain_config(chain_id_str)
-                if not chain_config:
-                    raise ValueError(f"Chain config not found for chain ID: {chain_id_str}")
-                
-                gateway_address = chain_config.get("gateway_address")
-                if not gateway_address:
-                    raise ValueError(f"Gateway address not found for chain ID: {chain_id_str}")
-                
-                init_data = encode_initialize_data(
-                    web3=evm_web3,
-                    contract_abi=UNIVERSAL_TOKEN_ABI,
-                    name=token_config["token_name"],
-                    symbol=token_config["token_symbol"],
-                    gateway_address=gateway_address,
-                    owner_address=service_account.address,
-                    gas=3000000
-                )
-                
-                logger.info(f"EVM initialization data prepared for {chain_id_str}: {len(init_data)} bytes")
-
-                # 2c. Deploy ERC1967 Proxy for EVM
-                logger.info(f"Deploying EVM ERC1967 proxy on chain {chain_id_str} with initialization data...")
-                
-                proxy_deploy_result = await deploy_erc1967_proxy(
-                    web3=evm_web3,
-                    account=service_account,
-                    implementation_address=evm_impl_address,
-                    init_data=init_data,
-                    gas_limit_override=5000000,
-                    is_zetachain=False  # This is an EVM chain deployment
-                )
-                
-                if not proxy_deploy_result.get("success"):
-                    raise ValueError(f"EVM proxy deployment failed: {proxy_deploy_result.get('message')}")
-                
-                evm_proxy_address = proxy_deploy_result.get("contract_address")
-                deployed_evm_proxies[chain_id_str] = evm_proxy_address
+                chain_json["implementation_address"] = evm_impl_address
+            if evm_proxy_address:
                 deployment_result["evmChains"][chain_id_str]["proxy_address"] = evm_proxy_address
-                deployment.connected_chains_json[chain_id_str]["contract_address"] = evm_proxy_address
-                deployment_result["evmChains"][chain_id_str]["status"] = "deployed"
-                deployment.connected_chains_json[chain_id_str]["status"] = "deployed"
-                flag_modified(deployment, "connected_chains_json")
-                logger.info(f"EVM proxy deployed and initialized for {chain_id_str}: {evm_proxy_address}")
-
-            except Exception as e:
-                logger.error(f"EVM deploy/init exception on {chain_id_str}: {e}", exc_info=True)
-                err_msg = f"EVM deploy/init exception on {chain_id_str}: {e}"
-                deployment_result["evmChains"][chain_id_str]["status"] = "failed"
-                deployment_result["evmChains"][chain_id_str]["message"] = err_msg
-                if not deployment.connected_chains_json: deployment.connected_chains_json = {}
-                if chain_id_str not in deployment.connected_chains_json: deployment.connected_chains_json[chain_id_str] = {}
-                deployment.connected_chains_json[chain_id_str]["status"] = "failed"
-                deployment.connected_chains_json[chain_id_str]["error_message"] = err_msg
-                if evm_impl_address: deployment.connected_chains_json[chain_id_str]["implementation_address"] = evm_impl_address
-                if evm_proxy_address: deployment.connected_chains_json[chain_id_str]["contract_address"] = evm_proxy_address
-                flag_modified(deployment, "connected_chains_json")
-                # Continue to the next chain
+                chain_json["contract_address"] = evm_proxy_address
+            if outcome["status"] == "deployed":
+                deployed_evm_proxies[chain_id_str] = evm_proxy_address
+            else:
+                deployment_result["evmChains"][chain_id_str]["message"] = outcome["message"]
+                chain_json["error_message"] = outcome["message"]
+            flag_modified(deployment, "connected_chains_json")
+            db.add(deployment)
+            db.commit()
+            logger.info(f"EVM chain {chain_id_str} finished with status {outcome['status']}")
 
         # Commit intermediate EVM deployment statuses
         db.add(deployment)
@@ -585,34 +549,57 @@ class DeploymentService:
                     else:
                         address_allocations[address] = amount
             
-            # Process each allocation
+            # Sign every transfer up front with consecutive nonces and send them
+            # back-to-back, then wait for all receipts together rather than one
+            # full send/confirm round-trip per recipient
+            token_decimals = int(token_config["decimals"])
+            pending_transfers = []
+            if address_allocations:
+                gas_price, nonce, chain_id = await fetch_tx_params(zc_web3, service_account.address)
             for address, amount in address_allocations.items():
                 try:
                     # Convert amount to wei (considering decimals)
-                    token_decimals = int(token_config["decimals"])
                     amount_wei = amount * (10 ** token_decimals)
-                    
-                    # Execute transfer from service account to recipient
-                    transfer_result = await call_contract_method(
-                        web3=zc_web3,
-                        account=service_account,
-                        contract_address=zc_proxy_address,
-                        contract_abi=ZC_UNIVERSAL_TOKEN_ABI,
-                        method_name="transfer",
-                        args=[Web3.to_checksum_address(address), amount_wei],
-                        gas_limit=500000
+                    raw_tx = sign_raw_call(
+                        service_account,
+                        zc_proxy_address,
+                        SELECTOR_TRANSFER,
+                        TRANSFER_TYPES,
+                        [Web3.to_checksum_address(address), amount_wei],
+                        gas=500000,
+                        gas_price=gas_price,
+                        nonce=nonce,
+                        chain_id=chain_id
                     )
-                    
-                    if transfer_result.get("success"):
-                        allocation_success_count += 1
-                        logger.info(f"Successfully transferred {amount} tokens to {address}")
-                    else:
-                        allocation_failure_count += 1
-                        logger.error(f"Failed to transfer {amount} tokens to {address}: {transfer_result.get('message')}")
-                
+                    tx_hash = zc_web3.eth.send_raw_transaction(raw_tx)
+                    nonce += 1
+                    pending_transfers.append((address, amount, tx_hash))
                 except Exception as e:
                     allocation_failure_count += 1
                     logger.error(f"Exception transferring tokens to {address}: {e}", exc_info=True)
+
+            # Bound the receipt waits so a long allocation list doesn't tie up the
+            # shared thread pool that every other to_thread caller depends on
+            receipt_slots = asyncio.Semaphore(RECEIPT_WAIT_CONCURRENCY)
+
+            async def wait_for_receipt(tx_hash):
+                async with receipt_slots:
+                    return await asyncio.to_thread(zc_web3.eth.wait_for_transaction_receipt, tx_hash, timeout=120)
+
+            receipts = await asyncio.gather(
+                *(wait_for_receipt(tx_hash) for _, _, tx_hash in pending_transfers),
+                return_exceptions=True
+            )
+            for (address, amount, tx_hash), receipt in zip(pending_transfers, receipts):
+                if isinstance(receipt, BaseException):
+                    allocation_failure_count += 1
+                    logger.error(f"Failed to transfer {amount} tokens to {address}: {receipt}")
+                elif receipt.status != 1:
+                    allocation_failure_count += 1
+                    logger.error(f"Failed to transfer {amount} tokens to {address}: transaction {zc_web3.to_hex(tx_hash)} reverted")
+                else:
+                    allocation_success_count += 1
+                    logger.info(f"Successfully transferred {amount} tokens to {address}")
         
         except Exception as e:
             logger.error(f"Error processing allocations: {e}", exc_info=True)
@@ -721,5 +708,96 @@ class DeploymentService:
         deployment_result["final_status"] = deployment.deployment_status
         return deployment_result
 
+    async def _deploy_evm_chain(
+        self,
+        chain_id_str: str,
+        token_config: Dict[str, Any],
+        service_account
+    ) -> Dict[str, Any]:
+        """
+        Deploy the standard implementation and initialized proxy on one EVM chain.
+
+        Args:
+            chain_id_str: EVM chain ID (string)
+            token_config: Token details (name, symbol, decimals, total_supply)
+            service_account: Service deployer account
+
+        Returns:
+            Dict with status, implementation_address, proxy_address and message.
+        """
+        logger.info(f"Deploying standard implementation and proxy to EVM chain {chain_id_str}...")
+        result = {"status": "failed", "implementation_address": None, "proxy_address": None, "message": None}
+
+        try:
+            numeric_chain_id = int(chain_id_str)
+            evm_web3 = await get_web3(numeric_chain_id)
+            if not evm_web3:
+                raise ConnectionError(f"Failed to connect to EVM chain {chain_id_str}")
+
+            # Deploy implementation contract
+            logger.info(f"Deploying EVM implementation contract on chain {chain_id_str}...")
+
+            impl_deploy_result = await deploy_implementation(
+                web3=evm_web3,
+                account=service_account,
+                contract_abi=UNIVERSAL_TOKEN_ABI,
+                contract_bytecode=UNIVERSAL_TOKEN_BYTECODE,
+                constructor_args=None,
+                gas_limit_override=5000000
+            )
+
+            if not impl_deploy_result.get("success"):
+                raise ValueError(f"EVM implementation deployment failed: {impl_deploy_result.get('message')}")
+
+            evm_impl_address = impl_deploy_result.get("contract_address")
+            result["implementation_address"] = evm_impl_address
+            logger.info(f"EVM implementation deployed for {chain_id_str}: {evm_impl_address}")
+
+            # Prepare initialization data for EVM token
+            chain_config = Config.get_chain_config(chain_id_str)
+            if not chain_config:
+                raise ValueError(f"Chain config not found for chain ID: {chain_id_str}")
+
+            gateway_address = chain_config.get("gateway_address")
+            if not gateway_address:
+                raise ValueError(f"Gateway address not found for chain ID: {chain_id_str}")
+
+            init_data = encode_initialize_data(
+                web3=evm_web3,
+                contract_abi=UNIVERSAL_TOKEN_ABI,
+                name=token_config["token_name"],
+                symbol=token_config["token_symbol"],
+                gateway_address=gateway_address,
+                owner_address=service_account.address,
+                gas=3000000
+            )
+
+            logger.info(f"EVM initialization data prepared for {chain_id_str}: {len(init_data)} bytes")
+
+            # Deploy ERC1967 Proxy for EVM
+            logger.info(f"Deploying EVM ERC1967 proxy on chain {chain_id_str} with initialization data...")
+
+            proxy_deploy_result = await deploy_erc1967_proxy(
+                web3=evm_web3,
+                account=service_account,
+                implementation_address=evm_impl_address,
+                init_data=init_data,
+                gas_limit_override=5000000,
+                is_zetachain=False  # This is an EVM chain deployment
+            )
+
+            if not proxy_deploy_result.get("success"):
+                raise ValueError(f"EVM proxy deployment failed: {proxy_deploy_result.get('message')}")
+
+            result["proxy_address"] = proxy_deploy_result.get("contract_address")
+            result["status"] = "deployed"
+            logger.info(f"EVM proxy deployed and initialized for {chain_id_str}: {result['proxy_address']}")
+
+        except Exception as e:
+            logger.error(f"EVM deploy/init exception on {chain_id_str}: {e}", exc_info=True)
+            result["message"] = f"EVM deploy/init exception on {chain_id_str}: {e}"
+
+        return result
+
 # Instantiate service
 deployment_service = DeploymentService() 
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Token service for querying token information."""
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import Dict, Any, Optional
 
@@ -57,7 +58,7 @@ class TokenService:
             
             # First try to find by ZetaChain contract address
             token = db.query(TokenModel).filter(
-                TokenModel.zc_contract_address.ilike(address)
+                func.lower(TokenModel.zc_contract_address) == address
             ).first()
             
             if token:
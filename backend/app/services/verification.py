@@ -1,20 +1,29 @@
 """Verification service for token contracts."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 import json
 import asyncio
+import os
 import sys
 import re
 
 from app.utils.logger import logger
 from app.utils.chain_config import get_chain_config
-from app.utils.web3_helper import verify_contract_submission, get_web3
+from app.utils.web3_helper import VerifyJob, get_web3, load_contract_source, verify_many
 from app.models import TokenModel
 from app.models.nft import NFTCollectionModel
 
 
+# Contract sources live in smart-contracts/contracts at the repository root
+CONTRACTS_SOURCE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    "smart-contracts",
+    "contracts"
+)
+
+
 class VerificationService:
     """Service for verifying deployed contracts on block explorers."""
 
@@ -34,13 +43,90 @@ class VerificationService:
             contract_address: Address of the deployed contract
             chain_id: Chain ID where contract is deployed
             contract_type: Type of contract (zetachain or evm)
-            contract_args: Optional constructor arguments for the contract
+            contract_args: Unused; the token and NFT contracts take no constructor arguments
             is_token: Flag to indicate if this is a token (True) or NFT (False) contract
             db: Optional database session for updating status
             
         Returns:
             Dict with verification results
         """
+        results = await self.verify_contracts(
+            [{
+                "contract_address": contract_address,
+                "chain_id": chain_id,
+                "contract_type": contract_type,
+                "is_token": is_token
+            }],
+            db=db
+        )
+        return results[0]
+
+    async def verify_contracts(
+        self,
+        contracts: List[Dict[str, Any]],
+        db: Session = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Verify several contracts, submitting and polling them concurrently.
+        
+        Args:
+            contracts: One dict per contract with contract_address, chain_id,
+                contract_type and optionally is_token (defaults to True)
+            db: Optional database session for updating status
+            
+        Returns:
+            List of verification results in the same order as contracts; each has
+            a "status" of "success", "pending" or "failed"
+        """
+        results = [None] * len(contracts)
+        jobs = []
+        job_indexes = []
+        for index, contract in enumerate(contracts):
+            job, error = self._build_verification_job(
+                contract_address=contract["contract_address"],
+                chain_id=contract["chain_id"],
+                contract_type=contract["contract_type"],
+                is_token=contract.get("is_token", True)
+            )
+            if error:
+                results[index] = error
+            else:
+                jobs.append(job)
+                job_indexes.append(index)
+        
+        # Submissions run in one gather and the accepted ones are polled in a second
+        for index, verification_result in zip(job_indexes, await verify_many(jobs)):
+            verification_result["status"] = _summarize_status(verification_result)
+            results[index] = verification_result
+        
+        # Update database if session provided
+        if db:
+            for index in job_indexes:
+                contract = contracts[index]
+                await self._update_verification_status(
+                    db=db,
+                    chain_id=contract["chain_id"],
+                    contract_address=contract["contract_address"],
+                    is_zetachain=contract["contract_type"].lower() == "zetachain",
+                    verification_result=results[index],
+                    is_token=contract.get("is_token", True)
+                )
+        
+        return results
+
+    def _build_verification_job(
+        self,
+        contract_address: str,
+        chain_id: str,
+        contract_type: str,
+        is_token: bool = True
+    ) -> Tuple[Optional[VerifyJob], Optional[Dict[str, Any]]]:
+        """
+        Resolve the explorer, API key and contract source for one verification.
+        
+        Returns:
+            Tuple of (job, None), or (None, failed result) if the contract can't be verified
+        """
         logger.info(
             f"Verifying {contract_type} {'token' if is_token else 'NFT'} contract {contract_address} on chain {chain_id}"
         )
@@ -48,11 +134,17 @@ class VerificationService:
         try:
             numeric_chain_id = int(chain_id)
         except ValueError:
-            return {"success": False, "message": f"Invalid chain ID: {chain_id}", "status": "failed"}
+            return None, {"success": False, "message": f"Invalid chain ID: {chain_id}", "status": "failed"}
         
         chain_config = get_chain_config(numeric_chain_id)
         if not chain_config:
-            return {"success": False, "message": f"Chain ID {chain_id} not supported", "status": "failed"}
+            return None, {"success": False, "message": f"Chain ID {chain_id} not supported", "status": "failed"}
+        
+        # Prefer Blockscout, which needs no API key and verifies synchronously
+        explorer_base_url = chain_config.get("blockscout_url") or chain_config.get("explorer_url")
+        if not explorer_base_url:
+            return None, {"success": False, "message": f"No block explorer configured for chain {chain_id}", "status": "failed"}
+        is_blockscout = bool(chain_config.get("blockscout_url"))
         
         is_zetachain = (contract_type.lower() == "zetachain")
         
@@ -64,45 +156,24 @@ class VerificationService:
             
         logger.info(f"Using contract name: {contract_name} for verification")
         
-        # Prepare constructor arguments list if provided
-        constructor_arg_list = None
-        if contract_args and not is_zetachain:
-            logger.info(f"Processing constructor arguments: {contract_args}")
-            if contract_name == "EVMUniversalToken":
-                constructor_arg_list = [
-                    contract_args.get("name", ""),
-                    contract_args.get("symbol", ""),
-                    int(contract_args.get("decimals", 18)),
-                    int(contract_args.get("supply", 0)),
-                    int(chain_id),
-                    contract_args.get("owner", "0x0000000000000000000000000000000000000000")
-                ]
-                logger.info(f"Prepared constructor args: {constructor_arg_list}")
-            elif contract_name == "EVMUniversalNFT":
-                # Handle NFT constructor args if needed
-                pass
-        
-        # Submit verification request to block explorer
-        verification_result = verify_contract_submission(
-            chain_id=numeric_chain_id,
-            contract_address=contract_address,
-            contract_name=contract_name,
-            is_zetachain=is_zetachain,
-            constructor_args=constructor_arg_list
-        )
-        
-        # Update database if session provided
-        if db and verification_result:
-            await self._update_verification_status(
-                db=db,
-                chain_id=chain_id,
-                contract_address=contract_address,
-                is_zetachain=is_zetachain,
-                verification_result=verification_result,
-                is_token=is_token
-            )
+        contract_path = os.path.join(CONTRACTS_SOURCE_DIR, f"{contract_name}.sol")
+        try:
+            source_code, compiler_version = load_contract_source(contract_path)
+        except OSError as e:
+            logger.error(f"Contract source for {contract_name} not found: {e}")
+            return None, {"success": False, "message": f"Contract source not found: {contract_path}", "status": "failed"}
         
-        return verification_result
+        job: VerifyJob = {
+            "explorer_base_url": explorer_base_url,
+            "api_key": chain_config.get("api_key", ""),
+            "contract_address": contract_address,
+            "contract_name": contract_name,
+            # verify_contract_submission adds the "v" prefix itself
+            "compiler_version": compiler_version.removeprefix("v"),
+            "source_code": source_code,
+            "is_blockscout": is_blockscout
+        }
+        return job, None
     
     async def _update_evm_verification_status(
         self,
@@ -224,5 +295,13 @@ class VerificationService:
             db.rollback()
 
 
+def _summarize_status(verification_result: Dict[str, Any]) -> str:
+    """Collapse a verify_many result into "success", "pending" or "failed"."""
+    if verification_result.get("is_complete"):
+        return "success" if verification_result.get("success") else "failed"
+    # Accepted submissions carry a GUID; the explorer hasn't reached a verdict yet
+    return "pending" if verification_result.get("guid") else "failed"
+
+
 # Singleton instance
 verification_service = VerificationService() 
\ No newline at end of file
@@ -11,11 +11,13 @@ from app.utils.logger import logger
 _chain_configs = {}
 # Cache for chain config with API keys/URLs added
 _processed_chain_configs = {}
+# Cache for enabled chains keyed by (testnet_only, mainnet_only)
+_enabled_chains = {}
 
 
 def load_chain_configs():
     """Load chain configurations from the rpc_config.json file."""
-    global _chain_configs, _processed_chain_configs
+    global _chain_configs, _processed_chain_configs, _enabled_chains
     
     # Path to config file relative to this module
     config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'rpc_config.json')
@@ -32,8 +34,11 @@ def load_chain_configs():
         logger.error(f"Error loading chain configurations: {str(e)}")
         _chain_configs = {}
     
-    # Clear the processed configs cache when loading new configs
+    # Clear the processed configs caches when loading new configs
     _processed_chain_configs = {}
+    _enabled_chains = {}
+    if 'get_chain_config' in globals():
+        get_chain_config.cache_clear()
 
 
 @functools.lru_cache(maxsize=32)
@@ -160,8 +165,12 @@ def get_enabled_chains(testnet_only=False, mainnet_only=False) -> Dict[str, Dict
         mainnet_only: If True, return only enabled mainnet chains
         
     Returns:
-        Dictionary of enabled chains with chain IDs as keys
+        Dictionary of enabled chains with chain IDs as keys (cached; treat as read-only)
     """
+    cache_key = (bool(testnet_only), bool(mainnet_only))
+    if cache_key in _enabled_chains:
+        return _enabled_chains[cache_key]
+    
     # Get all supported chains with filtering
     chains = get_supported_chains(testnet_only, mainnet_only)
     
@@ -169,6 +178,7 @@ def get_enabled_chains(testnet_only=False, mainnet_only=False) -> Dict[str, Dict
     enabled_chains = {k: v for k, v in chains.items() if v.get('enabled', True)}
     
     logger.debug(f"Found {len(enabled_chains)} enabled chains")
+    _enabled_chains[cache_key] = enabled_chains
     return enabled_chains
 
 
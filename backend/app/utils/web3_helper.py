@@ -1,13 +1,25 @@
 """Web3 helper utilities for interacting with blockchain networks."""
 
-from typing import Dict, Any, Optional, List, Union, Tuple
-from web3 import Web3
+from typing import Dict, Any, Optional, List, Union, Tuple, TypedDict
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
+import asyncio
+import eth_abi
+import functools
+from collections import OrderedDict
+from pathlib import Path
+import httpx
 import json
+import orjson
 import os
+import re
+import requests
+import rlp
 import time
 from web3.exceptions import TransactionNotFound
+from eth_utils import keccak, to_bytes, to_checksum_address
+from eth_utils.abi import collapse_if_tuple
 
 from app.utils.logger import logger
 from app.utils.chain_config import get_chain_config
@@ -26,6 +38,39 @@ ERC1967_PROXY_BYTECODE = None
 # Compatible bytecode (compiled with Solidity 0.8.19) for chains without PUSH0 support
 COMPATIBLE_ERC1967_PROXY_BYTECODE = "0x60806040523661001357610011610017565b005b6100115b610027610022610067565b61009f565b565b606061004e8383604051806060016040528060278152602001610268602791396100c3565b9392505050565b6001600160a01b03163b151590565b90565b600061009a7f360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc546001600160a01b031690565b905090565b3660008037600080366000845af43d6000803e8080156100be573d6000f35b3d6000fd5b6060600080856001600160a01b0316856040516100e09190610218565b600060405180830381855af49150503d806000811461011b576040519150601f19603f3d011682016040523d82523d6000602084013e610120565b606091505b50915091506101318683838761013b565b9695505050505050565b606083156101ac5782516101a5576001600160a01b0385163b6101a55760405162461bcd60e51b815260206004820152601d60248201527f416464726573733a2063616c6c20746f206e6f6e2d636f6e747261637400000060448201526064015b60405180910390fd5b50816101b6565b6101b683836101be565b949350505050565b8151156101ce5781518083602001fd5b8060405162461bcd60e51b815260040161019c9190610234565b60005b838110156102035781810151838201526020016101eb565b83811115610212576000848401525b50505050565b6000825161022a8184602087016101e8565b9190910192915050565b60208152600082518060208401526102538160408501602087016101e8565b601f01601f1916919091016040019291505056fe416464726573733a206c6f772d6c6576656c2064656c65676174652063616c6c206661696c6564a2646970667358221220ff8e6f2d761d58b3bd984933269e01a7ff1f70a460b808056daa4cff1ee8ab6964736f6c63430008090033"
 
+# --- Multicall3 (deployed at the same address on most EVM chains) ---
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {"internalType": "bool", "name": "requireSuccess", "type": "bool"},
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "tryAggregate",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
 # Path to artifacts - relative to the backend directory
 ARTIFACTS_DIR = os.path.abspath(os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
@@ -94,9 +139,13 @@ async def call_contract_method(
     value: int = 0,
     gas_limit: int = 1000000,
     max_retries: int = 3,
-    retry_delay: int = 5
+    retry_delay: int = 5,
+    skip_estimate: bool = False
 ) -> Dict[str, Any]:
-    """Builds, signs, and sends a transaction to call a contract method."""
+    """Builds, signs, and sends a transaction to call a contract method.
+
+    With skip_estimate=True, gas_limit is used as-is and no eth_estimateGas call is made.
+    """
     try:
         contract_address = web3.to_checksum_address(contract_address)
         contract = web3.eth.contract(address=contract_address, abi=contract_abi)
@@ -117,6 +166,9 @@ async def call_contract_method(
                 'value': value,
                 'gasPrice': gas_price,  # Use current gas price
             }
+            if skip_estimate:
+                # build_transaction only estimates gas when no limit is given
+                tx_params['gas'] = gas_limit
         except Exception as e:
             logger.error(f"Failed to prepare transaction parameters: {e}")
             return {"success": False, "error": True, "message": f"Failed to prepare parameters: {e}"}
@@ -228,84 +280,297 @@ async def call_contract_method(
         return {"success": False, "error": True, "message": f"Error calling contract method: {str(e)}"}
 
 
-def load_contract_data() -> bool:
-    """Load contract ABIs and bytecode from filesystem (artifact files)."""
-    global UNIVERSAL_TOKEN_ABI, UNIVERSAL_TOKEN_BYTECODE
-    global ZC_UNIVERSAL_TOKEN_ABI, ZC_UNIVERSAL_TOKEN_BYTECODE
-    global ERC1967_PROXY_ABI, ERC1967_PROXY_BYTECODE
+def compute_create_address(sender: str, nonce: int) -> str:
+    """
+    Compute the address of a contract deployed by sender with the given nonce.
+
+    CREATE addresses are keccak256(rlp([sender, nonce]))[12:], so the address is known
+    as soon as the deployment transaction is signed.
+
+    Args:
+        sender: Deployer address
+        nonce: Nonce of the deployment transaction
+
+    Returns:
+        Checksummed contract address
+    """
+    return to_checksum_address(keccak(rlp.encode([to_bytes(hexstr=sender), nonce]))[12:])
+
+
+# Arachnid's deterministic deployment proxy; it lives at the same address on every chain
+# where it has been deployed and takes salt (32 bytes) + init code as calldata
+CREATE2_FACTORY_ADDRESS = "0x4e59b44847b379578588920cA78FbF26c0B4956C"
+ZERO_SALT = b"\x00" * 32
+
+
+def compute_create2_address(init_code: bytes, salt: bytes = ZERO_SALT, factory: str = CREATE2_FACTORY_ADDRESS) -> str:
+    """
+    Compute the address of a contract deployed through a CREATE2 factory.
+
+    CREATE2 addresses are keccak256(0xff ++ factory ++ salt ++ keccak256(init_code))[12:],
+    so the same init code and salt give the same address on every chain.
+
+    Args:
+        init_code: Contract creation bytecode, including any encoded constructor arguments
+        salt: 32-byte salt
+        factory: Address of the CREATE2 factory
+
+    Returns:
+        Checksummed contract address
+    """
+    return to_checksum_address(keccak(b"\xff" + to_bytes(hexstr=factory) + salt + keccak(init_code))[12:])
+
+
+# Chain ID per RPC URL; it never changes for a given endpoint
+_chain_ids: Dict[str, int] = {}
+
+
+def get_chain_id(web3: Web3) -> int:
+    """Chain ID of the node behind a Web3 instance, fetched once per RPC URL."""
+    endpoint = getattr(web3.provider, 'endpoint_uri', None)
+    if endpoint is None:
+        return web3.eth.chain_id
+    if endpoint not in _chain_ids:
+        _chain_ids[endpoint] = web3.eth.chain_id
+    return _chain_ids[endpoint]
+
+
+async def fetch_tx_params(web3: Web3, address: str) -> Tuple[int, int, int]:
+    """
+    Fetch the gas price, pending nonce and chain ID needed to sign a transaction.
+
+    The node round-trips run concurrently, and the chain ID is cached per RPC URL.
+
+    Args:
+        web3: Web3 instance
+        address: Sender address
+
+    Returns:
+        Tuple of (gas_price, nonce, chain_id)
+    """
+    gas_price, nonce, chain_id = await asyncio.gather(
+        asyncio.to_thread(lambda: web3.eth.gas_price),
+        asyncio.to_thread(web3.eth.get_transaction_count, address, 'pending'),
+        asyncio.to_thread(get_chain_id, web3)
+    )
+    return gas_price, nonce, chain_id
 
+
+def raw_transaction_bytes(signed_tx) -> bytes:
+    """Raw bytes of a signed transaction; eth-account renamed rawTransaction to raw_transaction in 0.13."""
+    return getattr(signed_tx, 'rawTransaction', None) or signed_tx.raw_transaction
+
+
+def encode_raw_call(selector: bytes, param_types: List[str], params: List) -> bytes:
+    """Calldata for a contract call: the 4-byte selector followed by the ABI-encoded parameters."""
+    return selector + eth_abi.encode(param_types, params)
+
+
+def sign_raw_call(
+    account: LocalAccount,
+    to: str,
+    selector: bytes,
+    param_types: List[str],
+    params: List,
+    gas: int,
+    gas_price: int,
+    nonce: int,
+    value: int = 0,
+    chain_id: Optional[int] = None
+) -> bytes:
+    """
+    Sign a contract call whose calldata is ABI-encoded directly.
+
+    Args:
+        account: Account to sign with
+        to: Contract address
+        selector: 4-byte function selector
+        param_types: ABI types of the function parameters
+        params: Parameter values
+        gas: Gas limit for the transaction
+        gas_price: Gas price in wei
+        nonce: Nonce to sign the transaction with
+        value: Wei to send with the call
+        chain_id: Chain ID for EIP-155 replay protection
+
+    Returns:
+        Raw signed transaction ready for eth_sendRawTransaction
+    """
+    tx = {
+        'from': account.address,
+        'to': to,
+        'data': encode_raw_call(selector, param_types, params),
+        'value': value,
+        'gas': gas,
+        'gasPrice': gas_price,
+        'nonce': nonce
+    }
+    if chain_id is not None:
+        tx['chainId'] = chain_id
+    return raw_transaction_bytes(account.sign_transaction(tx))
+
+
+async def send_raw_call(
+    web3: Web3,
+    account: LocalAccount,
+    to: str,
+    selector: bytes,
+    param_types: List[str],
+    params: List,
+    gas: int,
+    value: int = 0
+) -> Dict[str, Any]:
+    """
+    Sign and send a contract call whose calldata is ABI-encoded directly.
+
+    Skips the Contract wrapper, gas estimation and ABI lookup done by
+    call_contract_method; the caller supplies the function selector and
+    parameter types.
+
+    Args:
+        web3: Web3 instance
+        account: Account to send from
+        to: Contract address
+        selector: 4-byte function selector
+        param_types: ABI types of the function parameters
+        params: Parameter values
+        gas: Gas limit for the transaction
+        value: Wei to send with the call
+
+    Returns:
+        Dict with success flag, transaction hash and receipt, in the same shape as call_contract_method
+    """
     try:
-        # --- Load EVM Token Artifact ---
-        if not os.path.exists(EVM_TOKEN_PATH):
-            logger.error(f"EVM token artifact not found at {EVM_TOKEN_PATH}")
-            return False
-            
-        with open(EVM_TOKEN_PATH, 'r') as f:
-            evm_token_artifact = json.load(f)
-            UNIVERSAL_TOKEN_ABI = evm_token_artifact.get('abi')
-            UNIVERSAL_TOKEN_BYTECODE = evm_token_artifact.get('bytecode')
-            
-            if not UNIVERSAL_TOKEN_ABI or not UNIVERSAL_TOKEN_BYTECODE:
-                logger.error(f"EVM token artifact at {EVM_TOKEN_PATH} missing ABI/bytecode")
-                return False
-                
-            logger.info(f"Loaded EVM token artifact from {EVM_TOKEN_PATH}")
-            logger.info(f"EVM bytecode length: {len(UNIVERSAL_TOKEN_BYTECODE) if UNIVERSAL_TOKEN_BYTECODE else 0}")
-            logger.info(f"EVM ABI has initialize: {any(m.get('name') == 'initialize' for m in UNIVERSAL_TOKEN_ABI if isinstance(m, dict) and 'name' in m)}")
+        gas_price, nonce, chain_id = await fetch_tx_params(web3, account.address)
+        raw_tx = sign_raw_call(
+            account, to, selector, param_types, params, gas,
+            gas_price=gas_price,
+            nonce=nonce,
+            value=value,
+            chain_id=chain_id
+        )
+        tx_hash = web3.eth.send_raw_transaction(raw_tx)
+        logger.info(f"Transaction {web3.to_hex(tx_hash)} sent")
 
-        # --- Load ZetaChain Token Artifact ---
-        if not os.path.exists(ZC_TOKEN_PATH):
-            logger.error(f"ZetaChain token artifact not found at {ZC_TOKEN_PATH}")
-            return False
-            
-        with open(ZC_TOKEN_PATH, 'r') as f:
-            zc_token_artifact = json.load(f)
-            ZC_UNIVERSAL_TOKEN_ABI = zc_token_artifact.get('abi')
-            ZC_UNIVERSAL_TOKEN_BYTECODE = zc_token_artifact.get('bytecode')
-            
-            if not ZC_UNIVERSAL_TOKEN_ABI or not ZC_UNIVERSAL_TOKEN_BYTECODE:
-                logger.error(f"ZetaChain token artifact at {ZC_TOKEN_PATH} missing ABI/bytecode")
-                return False
-                
-            logger.info(f"Loaded ZetaChain token artifact from {ZC_TOKEN_PATH}")
-            logger.info(f"ZetaChain bytecode length: {len(ZC_UNIVERSAL_TOKEN_BYTECODE) if ZC_UNIVERSAL_TOKEN_BYTECODE else 0}")
-            logger.info(f"ZetaChain ABI has initialize: {any(m.get('name') == 'initialize' for m in ZC_UNIVERSAL_TOKEN_ABI if isinstance(m, dict) and 'name' in m)}")
-            
-        # --- Load ERC1967 Proxy Artifact ---
-        if not os.path.exists(ERC1967_PROXY_PATH):
-            logger.error(f"ERC1967 Proxy artifact not found at {ERC1967_PROXY_PATH}")
-            return False
-            
-        with open(ERC1967_PROXY_PATH, 'r') as f:
-            proxy_artifact = json.load(f)
-            ERC1967_PROXY_ABI = proxy_artifact.get('abi')
-            ERC1967_PROXY_BYTECODE = proxy_artifact.get('bytecode')
-            if not ERC1967_PROXY_ABI or not ERC1967_PROXY_BYTECODE:
-                logger.error(f"ERC1967 Proxy artifact at {ERC1967_PROXY_PATH} missing ABI/bytecode")
-                return False
-            logger.info(f"Loaded ERC1967 Proxy artifact from {ERC1967_PROXY_PATH}")
-            logger.info(f"Proxy bytecode length: {len(ERC1967_PROXY_BYTECODE) if ERC1967_PROXY_BYTECODE else 0}")
-
-        logger.info("Contract data loaded successfully")
-        return True
+        receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        receipt_dict = receipt_to_dict(web3, receipt)
+        if receipt.status != 1:
+            logger.error(f"Call to {to} reverted. Tx: {web3.to_hex(tx_hash)}")
+            return {"success": False, "error": True, "transaction_hash": web3.to_hex(tx_hash), "message": "Transaction reverted", "receipt": receipt_dict}
 
+        return {"success": True, "error": False, "transaction_hash": web3.to_hex(tx_hash), "receipt": receipt_dict}
     except Exception as e:
-        logger.error(f"Error loading contract data: {e}", exc_info=True)
-        return False
+        logger.error(f"Error sending raw call to {to}: {e}")
+        return {"success": False, "error": True, "message": f"Error sending raw call: {e}"}
 
-# Load contract data when this module is imported
-load_contract_data()
 
-async def get_web3(chain_id: Union[int, str]) -> Web3:
-    """
-    Get a Web3 instance connected to the specified chain.
+def receipt_to_dict(web3: Web3, receipt) -> Dict[str, Any]:
+    """Convert a transaction receipt to a JSON-serializable dict, hex-encoding bytes values."""
+    return {
+        k: (web3.to_hex(v) if isinstance(v, bytes) else v)
+        for k, v in receipt.items()
+    }
+
+
+@functools.lru_cache(maxsize=32)
+def _read_artifact(artifact_path: str, mtime_ns: int) -> Tuple[List, str]:
+    """Read and parse an artifact file. Cached per (path, mtime); failures raise and are not cached."""
+    artifact = orjson.loads(Path(artifact_path).read_bytes())
+    return artifact.get('abi'), artifact.get('bytecode')
 
+
+def _load_artifact(artifact_path: Union[str, os.PathLike]) -> Tuple[Optional[List], Optional[str]]:
+    """
+    Load the ABI and bytecode from a compiled contract artifact.
+    
+    Parsed artifacts are cached on the file's path and modification time, so each
+    version of a file is parsed only once per process and later calls return the same
+    (shared, read-only) ABI list and bytecode string. Rewriting the file on disk
+    invalidates its entry.
+    
     Args:
-        chain_id: Chain ID or name of the chain to connect to
+        artifact_path: Path to the artifact JSON file
+        
+    Returns:
+        Tuple of (abi, bytecode), or (None, None) if the artifact could not be read
+    """
+    try:
+        path = os.fspath(artifact_path)
+        return _read_artifact(path, os.stat(path).st_mtime_ns)
+    except FileNotFoundError:
+        logger.error(f"Artifact not found at {artifact_path}")
+    except Exception as e:
+        logger.error(f"Error loading artifact {artifact_path}: {e}", exc_info=True)
+    return None, None
+
+
+_load_artifact.cache_clear = _read_artifact.cache_clear
+
 
+@functools.lru_cache(maxsize=32)
+def _bytecode_to_bytes(bytecode_hex: str) -> bytes:
+    """Decode hex bytecode once per distinct string."""
+    return bytes.fromhex(bytecode_hex.removeprefix('0x'))
+
+
+def load_bytecode_bytes(artifact_path: Union[str, os.PathLike]) -> Optional[bytes]:
+    """
+    Load an artifact's bytecode as raw bytes, ready to use as deployment calldata.
+    
+    Args:
+        artifact_path: Path to the artifact JSON file
+        
     Returns:
-        Web3 instance connected to the specified chain
+        The bytecode, or None if the artifact could not be read
     """
+    _, bytecode = _load_artifact(artifact_path)
+    if not bytecode:
+        return None
+    return _bytecode_to_bytes(bytecode)
+
+
+def load_contract_data() -> bool:
+    """Load contract ABIs and bytecode from filesystem (artifact files)."""
+    global UNIVERSAL_TOKEN_ABI, UNIVERSAL_TOKEN_BYTECODE
+    global ZC_UNIVERSAL_TOKEN_ABI, ZC_UNIVERSAL_TOKEN_BYTECODE
+    global ERC1967_PROXY_ABI, ERC1967_PROXY_BYTECODE
+
+    # --- Load EVM Token Artifact ---
+    UNIVERSAL_TOKEN_ABI, UNIVERSAL_TOKEN_BYTECODE = _load_artifact(EVM_TOKEN_PATH)
+    if not UNIVERSAL_TOKEN_ABI or not UNIVERSAL_TOKEN_BYTECODE:
+        logger.error(f"EVM token artifact at {EVM_TOKEN_PATH} missing ABI/bytecode")
+        return False
+        
+    logger.info(f"Loaded EVM token artifact from {EVM_TOKEN_PATH}")
+    logger.info(f"EVM bytecode length: {len(UNIVERSAL_TOKEN_BYTECODE)}")
+    logger.info(f"EVM ABI has initialize: {any(m.get('name') == 'initialize' for m in UNIVERSAL_TOKEN_ABI if isinstance(m, dict) and 'name' in m)}")
+
+    # --- Load ZetaChain Token Artifact ---
+    ZC_UNIVERSAL_TOKEN_ABI, ZC_UNIVERSAL_TOKEN_BYTECODE = _load_artifact(ZC_TOKEN_PATH)
+    if not ZC_UNIVERSAL_TOKEN_ABI or not ZC_UNIVERSAL_TOKEN_BYTECODE:
+        logger.error(f"ZetaChain token artifact at {ZC_TOKEN_PATH} missing ABI/bytecode")
+        return False
+        
+    logger.info(f"Loaded ZetaChain token artifact from {ZC_TOKEN_PATH}")
+    logger.info(f"ZetaChain bytecode length: {len(ZC_UNIVERSAL_TOKEN_BYTECODE)}")
+    logger.info(f"ZetaChain ABI has initialize: {any(m.get('name') == 'initialize' for m in ZC_UNIVERSAL_TOKEN_ABI if isinstance(m, dict) and 'name' in m)}")
+        
+    # --- Load ERC1967 Proxy Artifact ---
+    ERC1967_PROXY_ABI, ERC1967_PROXY_BYTECODE = _load_artifact(ERC1967_PROXY_PATH)
+    if not ERC1967_PROXY_ABI or not ERC1967_PROXY_BYTECODE:
+        logger.error(f"ERC1967 Proxy artifact at {ERC1967_PROXY_PATH} missing ABI/bytecode")
+        return False
+    logger.info(f"Loaded ERC1967 Proxy artifact from {ERC1967_PROXY_PATH}")
+    logger.info(f"Proxy bytecode length: {len(ERC1967_PROXY_BYTECODE)}")
+
+    logger.info("Contract data loaded successfully")
+    return True
+
+# Load contract data when this module is imported
+load_contract_data()
+
+def _get_rpc_url(chain_id: Union[int, str]) -> str:
+    """Look up the RPC URL for a chain, raising ValueError if it isn't configured."""
     # Convert chain_id to string if it's an integer
     if isinstance(chain_id, int):
         chain_id = str(chain_id)
@@ -322,13 +587,102 @@ async def get_web3(chain_id: Union[int, str]) -> Web3:
         logger.error(f"RPC URL not found for chain ID: {chain_id}")
         raise ValueError(f"RPC URL not found for chain ID: {chain_id}")
     
-    # Initialize web3 instance
-    web3 = Web3(Web3.HTTPProvider(rpc_url))
+    return rpc_url
+
+def _new_http_session() -> requests.Session:
+    """
+    HTTP session shared by every chain's provider, pooling one keep-alive pool per RPC host.
+
+    Each host's pool is capped at RPC_MAX_CONCURRENCY connections and blocks when
+    exhausted, so concurrent deployments queue locally instead of bursting past
+    the provider's rate limits.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=Config.RPC_MAX_CONCURRENCY,
+        pool_block=True
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+_HTTP_SESSION = _new_http_session()
+
+@functools.lru_cache(maxsize=None)
+def _http_web3(rpc_url: str) -> Web3:
+    """Web3 instance for an RPC URL, cached so the shared keep-alive session is reused."""
+    return Web3(Web3.HTTPProvider(rpc_url, session=_HTTP_SESSION))
+
+async def get_web3(chain_id: Union[int, str]) -> Web3:
+    """
+    Get a Web3 instance connected to the specified chain.
+
+    Args:
+        chain_id: Chain ID or name of the chain to connect to
+
+    Returns:
+        Web3 instance connected to the specified chain
+    """
+    rpc_url = _get_rpc_url(chain_id)
+    
+    web3 = _http_web3(rpc_url)
     
     logger.info(f"Connected to chain ID {chain_id} at {rpc_url}")
     
     return web3
 
+async def get_async_web3(chain_id: Union[int, str]) -> AsyncWeb3:
+    """
+    Get an AsyncWeb3 instance connected to the specified chain.
+
+    The async provider uses its own aiohttp session, so its requests are not
+    counted against RPC_MAX_CONCURRENCY like the synchronous providers' are.
+
+    Args:
+        chain_id: Chain ID or name of the chain to connect to
+
+    Returns:
+        AsyncWeb3 instance whose eth methods are awaitable
+    """
+    rpc_url = _get_rpc_url(chain_id)
+    
+    web3 = AsyncWeb3(AsyncHTTPProvider(rpc_url))
+    
+    logger.info(f"Connected (async) to chain ID {chain_id} at {rpc_url}")
+    
+    return web3
+
+async def wait_for_code(
+    async_web3: AsyncWeb3,
+    contract_address: str,
+    timeout: float = 5,
+    poll_interval: float = 0.25
+) -> bytes:
+    """
+    Poll eth_getCode until the contract's code is visible or the timeout expires.
+
+    Args:
+        async_web3: AsyncWeb3 instance
+        contract_address: Address of the deployed contract
+        timeout: Maximum number of seconds to wait
+        poll_interval: Seconds to sleep between polls
+
+    Returns:
+        The contract code, or empty bytes if none appeared in time
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        code = await async_web3.eth.get_code(contract_address)
+        if code or time.monotonic() >= deadline:
+            return bytes(code)
+        await asyncio.sleep(poll_interval)
+
+@functools.lru_cache(maxsize=4)
+def _account_from_key(private_key: str) -> LocalAccount:
+    """Derive the account for a private key once; LocalAccount is safe to share for signing."""
+    return Account.from_key(private_key)
+
 def get_account():
     """Get a local account from private key."""
     private_key = os.environ.get('DEPLOYER_PRIVATE_KEY')
@@ -339,7 +693,166 @@ def get_account():
     if not private_key.startswith('0x'):
         private_key = '0x' + private_key
     
-    return Account.from_key(private_key)
+    return _account_from_key(private_key)
+
+def abi_function_names(abi: List[Dict[str, Any]]) -> set:
+    """Names of the functions declared in a contract ABI."""
+    return {item['name'] for item in abi if item.get('type') == 'function'}
+
+# ABI indexes keyed by id(abi) in a small LRU; the ABI itself is kept alongside so its id
+# can't be reused while cached. _load_artifact returns a new list after an artifact is
+# rebuilt, so the cache is bounded rather than holding every ABI ever indexed.
+ABI_INDEX_CACHE_SIZE = 8
+_abi_indexes: "OrderedDict[int, Tuple[List, Dict[Tuple[str, str], Dict[str, Any]]]]" = OrderedDict()
+
+def index_abi(abi: List[Dict[str, Any]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Index a contract ABI by (name, type) for O(1) entry lookups.
+    
+    The index is built once per ABI list; ABIs are loaded once and shared, so
+    later calls with the same list return the same dict.
+    
+    Args:
+        abi: Contract ABI
+        
+    Returns:
+        Dict mapping (name, type) to the ABI entry, e.g. index[('initialize', 'function')]
+        
+    Raises:
+        ValueError: If the ABI overloads a name, since one key can't tell the overloads apart
+    """
+    key = id(abi)
+    cached = _abi_indexes.get(key)
+    if cached is not None and cached[0] is abi:
+        _abi_indexes.move_to_end(key)
+        return cached[1]
+    
+    index = {}
+    for item in abi:
+        if not isinstance(item, dict):
+            continue
+        entry_key = (item.get('name'), item.get('type'))
+        if entry_key in index:
+            raise ValueError(f"ABI overloads {entry_key[1]} {entry_key[0]}; index_abi can't tell the overloads apart")
+        index[entry_key] = item
+    
+    _abi_indexes[key] = (abi, index)
+    _abi_indexes.move_to_end(key)
+    if len(_abi_indexes) > ABI_INDEX_CACHE_SIZE:
+        _abi_indexes.popitem(last=False)
+    return index
+
+def batch_rpc(web3: Web3, rpc_requests: List[Tuple[str, List[Any]]]) -> List[Any]:
+    """
+    Send several JSON-RPC requests to the node as a single batch request.
+
+    Args:
+        web3: Web3 instance backed by an HTTP provider
+        rpc_requests: (method, params) pairs, e.g. ("eth_gasPrice", [])
+
+    Returns:
+        The raw result of each request in the same order, or a ValueError for a request the node rejected
+    """
+    payload = [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+        for i, (method, params) in enumerate(rpc_requests)
+    ]
+    # Go through the shared session so batches count against the per-host connection cap
+    response = _HTTP_SESSION.post(web3.provider.endpoint_uri, json=payload, timeout=30)
+    response.raise_for_status()
+
+    # Batch responses may come back in any order; match them up by id
+    by_id = {item.get("id"): item for item in response.json()}
+    results = []
+    for i, (method, _) in enumerate(rpc_requests):
+        item = by_id.get(i, {})
+        if "result" in item:
+            results.append(item["result"])
+        else:
+            results.append(ValueError(f"{method} failed: {item.get('error', 'no response')}"))
+    return results
+
+def _batch_eth_call(web3: Web3, calls: List[Tuple[str, str]]) -> List[Tuple[bool, bytes]]:
+    """
+    Send several eth_calls to the node as a single JSON-RPC batch request.
+
+    Args:
+        web3: Web3 instance backed by an HTTP provider
+        calls: (target address, calldata) pairs
+
+    Returns:
+        (success, return data) pairs in the same order as calls
+    """
+    results = batch_rpc(web3, [("eth_call", [{"to": to, "data": data}, "latest"]) for to, data in calls])
+    return [
+        (False, b"") if isinstance(result, Exception) or result is None else (True, bytes.fromhex(result[2:]))
+        for result in results
+    ]
+
+def multicall_view_functions(web3: Web3, contract, fn_names: List[str]) -> Dict[str, Any]:
+    """
+    Call several argument-less view functions in a single round-trip.
+
+    Uses Multicall3 tryAggregate(false, ...) so a reverting function doesn't abort the batch.
+    If Multicall3 is not deployed on the chain, the calls are sent as one JSON-RPC batch
+    request instead, and as individual eth_calls if the provider can't take batches.
+
+    Args:
+        web3: Web3 instance
+        contract: Contract instance with an address
+        fn_names: Names of view functions taking no arguments
+
+    Returns:
+        Dict mapping function name to its decoded result, or the Exception raised for it
+    """
+    results = {}
+    calls = [(contract.address, contract.encodeABI(fn_name=name)) for name in fn_names]
+
+    try:
+        multicall = web3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+        responses = multicall.functions.tryAggregate(False, calls).call()
+    except Exception as e:
+        logger.warning(f"Multicall3 unavailable, falling back to a JSON-RPC batch: {e}")
+        try:
+            responses = _batch_eth_call(web3, calls)
+        except Exception as batch_error:
+            logger.warning(f"JSON-RPC batch failed, falling back to individual calls: {batch_error}")
+            for name in fn_names:
+                try:
+                    results[name] = contract.functions[name]().call()
+                except Exception as call_error:
+                    results[name] = call_error
+            return results
+
+    for name, (success, data) in zip(fn_names, responses):
+        if not success:
+            results[name] = ValueError(f"{name}() reverted")
+            continue
+        try:
+            fn_abi = contract.get_function_by_name(name).abi
+            output_types = [collapse_if_tuple(output) for output in fn_abi.get('outputs', [])]
+            decoded = web3.codec.decode(output_types, data)
+            results[name] = decoded[0] if len(decoded) == 1 else list(decoded)
+        except Exception as decode_error:
+            results[name] = decode_error
+
+    return results
+
+def multicall_result(results: Dict[str, Any], fn_name: str) -> Any:
+    """
+    Get one value from multicall_view_functions, re-raising the error recorded for it.
+
+    Args:
+        results: Dict returned by multicall_view_functions
+        fn_name: Function name to look up
+
+    Returns:
+        The decoded result of the call
+    """
+    value = results[fn_name]
+    if isinstance(value, Exception):
+        raise value
+    return value
 
 async def deploy_contract(
     web3: Web3,
@@ -512,6 +1025,76 @@ async def deploy_implementation(
         
     return result
 
+async def deploy_implementation_create2(
+    web3: Web3,
+    account: LocalAccount,
+    contract_bytecode: str,
+    salt: bytes = ZERO_SALT,
+    gas_limit_override: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Deploy an implementation contract at its deterministic CREATE2 address.
+
+    Implementations take no constructor arguments, so identical bytecode lands at the
+    same address on every chain. If code already exists there, the existing contract
+    is reused and no transaction is sent.
+
+    Args:
+        web3: Web3 instance
+        account: Account to deploy from
+        contract_bytecode: Contract bytecode
+        salt: 32-byte CREATE2 salt
+        gas_limit_override: Gas limit override
+
+    Returns:
+        Dict with deployment result; "reused" is True when no transaction was sent
+    """
+    try:
+        init_code = _bytecode_to_bytes(contract_bytecode)
+        expected_address = compute_create2_address(init_code, salt)
+
+        existing_code, factory_code = await asyncio.gather(
+            asyncio.to_thread(web3.eth.get_code, expected_address),
+            asyncio.to_thread(web3.eth.get_code, CREATE2_FACTORY_ADDRESS)
+        )
+        if existing_code:
+            logger.info(f"Implementation already deployed at {expected_address}, reusing it")
+            return {"success": True, "error": False, "contract_address": expected_address, "reused": True}
+
+        if not factory_code:
+            return {"success": False, "error": True, "message": f"CREATE2 factory not deployed at {CREATE2_FACTORY_ADDRESS}"}
+
+        gas_price, nonce, chain_id = await fetch_tx_params(web3, account.address)
+        tx = {
+            'from': account.address,
+            'to': CREATE2_FACTORY_ADDRESS,
+            'data': salt + init_code,
+            'value': 0,
+            'gasPrice': gas_price,
+            'nonce': nonce,
+            'chainId': chain_id
+        }
+        tx['gas'] = gas_limit_override or int(await asyncio.to_thread(web3.eth.estimate_gas, tx) * 1.2)
+
+        tx_hash = await asyncio.to_thread(web3.eth.send_raw_transaction, raw_transaction_bytes(account.sign_transaction(tx)))
+        logger.info(f"CREATE2 deployment transaction {web3.to_hex(tx_hash)} sent")
+
+        receipt = await asyncio.to_thread(web3.eth.wait_for_transaction_receipt, tx_hash, timeout=180)
+        if receipt.status != 1:
+            return {"success": False, "error": True, "transaction_hash": web3.to_hex(tx_hash), "message": "CREATE2 deployment reverted"}
+
+        logger.info(f"Implementation contract deployed at: {expected_address}")
+        return {
+            "success": True,
+            "error": False,
+            "contract_address": expected_address,
+            "transaction_hash": web3.to_hex(tx_hash),
+            "reused": False
+        }
+    except Exception as e:
+        logger.error(f"Error deploying implementation via CREATE2: {e}")
+        return {"success": False, "error": True, "message": f"Error deploying implementation via CREATE2: {e}"}
+
 def verify_init_data(web3: Web3, contract_abi: List, implementation_address: str, init_data: bytes) -> bool:
     """
     Verify that the initialization data is valid for the given implementation contract.
@@ -651,20 +1234,18 @@ def reload_erc1967_proxy() -> bool:
             logger.error(f"ERC1967 Proxy artifact not found at {ERC1967_PROXY_PATH}")
             return False
         
-        with open(ERC1967_PROXY_PATH, 'r') as f:
-            proxy_artifact = json.load(f)
-            ERC1967_PROXY_ABI = proxy_artifact.get('abi')
-            ERC1967_PROXY_BYTECODE = proxy_artifact.get('bytecode')
-            
-            if not ERC1967_PROXY_ABI or not ERC1967_PROXY_BYTECODE:
-                logger.error(f"ERC1967 Proxy artifact at {ERC1967_PROXY_PATH} missing ABI/bytecode")
-                return False
-                
-            logger.info(f"Reloaded ERC1967 Proxy artifact from {ERC1967_PROXY_PATH}")
-            logger.info(f"Proxy bytecode length: {len(ERC1967_PROXY_BYTECODE) if ERC1967_PROXY_BYTECODE else 0}")
-            logger.info(f"Proxy bytecode first 20 chars: {ERC1967_PROXY_BYTECODE[:20]}...")
+        # The artifact cache is keyed on mtime, so a rewritten file is parsed again
+        ERC1967_PROXY_ABI, ERC1967_PROXY_BYTECODE = _load_artifact(ERC1967_PROXY_PATH)
+        
+        if not ERC1967_PROXY_ABI or not ERC1967_PROXY_BYTECODE:
+            logger.error(f"ERC1967 Proxy artifact at {ERC1967_PROXY_PATH} missing ABI/bytecode")
+            return False
             
-            return True
+        logger.info(f"Reloaded ERC1967 Proxy artifact from {ERC1967_PROXY_PATH}")
+        logger.info(f"Proxy bytecode length: {len(ERC1967_PROXY_BYTECODE) if ERC1967_PROXY_BYTECODE else 0}")
+        logger.info(f"Proxy bytecode first 20 chars: {ERC1967_PROXY_BYTECODE[:20]}...")
+        
+        return True
             
     except Exception as e:
         logger.error(f"Error reloading ERC1967 Proxy data: {e}", exc_info=True)
@@ -789,6 +1370,103 @@ def extract_compiler_version(contract_path: str) -> str:
         return "v0.8.17+commit.8df45f5f"  # Default version
 
 
+
+# First concrete version named in a source's pragma, e.g. "^0.8.26" or ">=0.8.20 <0.9.0"
+_PRAGMA_SOLIDITY_RE = re.compile(r"pragma\s+solidity\s+[\^~>=<\s]*(\d+\.\d+\.\d+)")
+
+# Release commits of the solc versions our contracts are built with; verification
+# APIs expect the long form "v<version>+commit.<hash>"
+SOLC_RELEASE_COMMITS = {
+    "0.8.17": "8df45f5f",
+    "0.8.18": "87f61d96",
+    "0.8.19": "7dd6d404",
+    "0.8.20": "a1b79de6",
+    "0.8.21": "d9974bed",
+    "0.8.22": "4fc1097e",
+    "0.8.23": "f704f362",
+    "0.8.24": "e11b9ed9",
+    "0.8.25": "b61c2a91",
+    "0.8.26": "8a97fa7a",
+}
+
+
+def compiler_version_from_source(source: str) -> Optional[str]:
+    """
+    Read the compiler version from a Solidity source's pragma line.
+    
+    Args:
+        source: Solidity source code
+        
+    Returns:
+        Long-form version ("v0.8.26+commit.8a97fa7a") for known releases, "v0.8.x"
+        for others, or None if the source has no pragma solidity line
+    """
+    match = _PRAGMA_SOLIDITY_RE.search(source)
+    if not match:
+        return None
+    version = match.group(1)
+    commit = SOLC_RELEASE_COMMITS.get(version)
+    return f"v{version}+commit.{commit}" if commit else f"v{version}"
+
+
+@functools.lru_cache(maxsize=32)
+def _read_contract_source(contract_path: str, mtime_ns: int) -> Tuple[str, str]:
+    """Read a contract source and detect its compiler version. Cached per (path, mtime)."""
+    source = Path(contract_path).read_text()
+    compiler_version = compiler_version_from_source(source)
+    if not compiler_version:
+        logger.warning(f"No pragma solidity line in {contract_path}, using default compiler version")
+        compiler_version = "v0.8.17+commit.8df45f5f"
+    return source, compiler_version
+
+
+def load_contract_source(contract_path: Union[str, os.PathLike]) -> Tuple[str, str]:
+    """
+    Load a contract's source code together with its compiler version.
+    
+    Cached on the file's path and modification time like _load_artifact, so
+    repeated verifications of the same contract read and scan it only once.
+    
+    Args:
+        contract_path: Path to the contract source file
+        
+    Returns:
+        Tuple of (source, compiler_version)
+    """
+    path = os.fspath(contract_path)
+    return _read_contract_source(path, os.stat(path).st_mtime_ns)
+
+# Constant parts of the explorer verification API requests; per-call fields are merged in with |
+_BLOCKSCOUT_VERIFY_PARAMS = {
+    "module": "contract",
+    "action": "verify"
+}
+_ETHERSCAN_VERIFY_PARAMS = {
+    "module": "contract",
+    "action": "verifysourcecode",
+    "codeformat": "solidity-single-file"
+}
+_ETHERSCAN_STATUS_PARAMS = {
+    "module": "contract",
+    "action": "checkverifystatus"
+}
+
+
+class VerifyJob(TypedDict, total=False):
+    """Keyword arguments for a single verify_contract_submission call."""
+    explorer_base_url: str
+    api_key: str
+    contract_address: str
+    contract_name: str
+    compiler_version: str
+    optimization_used: bool
+    optimization_runs: int
+    source_code: str
+    contract_path: str
+    constructor_args: str
+    is_blockscout: bool
+
+
 async def verify_contract_submission(
     explorer_base_url: str,
     api_key: str,
@@ -848,12 +1526,10 @@ async def verify_contract_submission(
             compiler_version = extract_compiler_version(contract_path)
         
         # Prepare parameters based on explorer type
+        url = f"{explorer_base_url.rstrip('/')}/api"
         if is_blockscout:
             # Blockscout format
-            url = f"{explorer_base_url.rstrip('/')}/api"
-            params = {
-                "module": "contract",
-                "action": "verify",
+            params = _BLOCKSCOUT_VERIFY_PARAMS | {
                 "addressHash": contract_address,
                 "name": contract_name,
                 "compilerVersion": f"v{compiler_version}",
@@ -865,13 +1541,9 @@ async def verify_contract_submission(
                 params["constructorArguments"] = constructor_args
         else:
             # Etherscan-compatible format
-            url = f"{explorer_base_url.rstrip('/')}/api"
-            params = {
-                "module": "contract",
-                "action": "verifysourcecode",
+            params = _ETHERSCAN_VERIFY_PARAMS | {
                 "contractaddress": contract_address,
                 "sourceCode": source_code,
-                "codeformat": "solidity-single-file",
                 "contractname": contract_name,
                 "compilerversion": f"v{compiler_version}",
                 "optimizationUsed": "1" if optimization_used else "0",
@@ -884,7 +1556,6 @@ async def verify_contract_submission(
         logger.info(f"Submitting verification request to {url} for contract {contract_address}")
         
         # Send verification request
-        import httpx
         async with httpx.AsyncClient(timeout=30) as client:
             response = await client.post(url, data=params)
             
@@ -944,6 +1615,20 @@ async def verify_contract_submission(
         }
 
 
+# Explorer verification outcomes never change once they are final, so terminal statuses
+# are kept per (explorer, GUID) in a bounded LRU and returned without another HTTP call.
+TERMINAL_STATUS_CACHE_SIZE = 10_000
+_terminal_status: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+
+
+def _cache_terminal_status(key: Tuple[str, str], status: Dict[str, Any]) -> None:
+    """Remember a final verification status, evicting the least recently used entry when full."""
+    _terminal_status[key] = status
+    _terminal_status.move_to_end(key)
+    if len(_terminal_status) > TERMINAL_STATUS_CACHE_SIZE:
+        _terminal_status.popitem(last=False)
+
+
 async def check_verification_status(
     explorer_base_url: str,
     guid: str,
@@ -977,14 +1662,16 @@ async def check_verification_status(
             }
         else:
             # Etherscan-compatible
-            params = {
-                "module": "contract",
-                "action": "checkverifystatus",
+            cache_key = (url, guid)
+            if cache_key in _terminal_status:
+                _terminal_status.move_to_end(cache_key)
+                return _terminal_status[cache_key]
+            
+            params = _ETHERSCAN_STATUS_PARAMS | {
                 "guid": guid,
                 "apikey": api_key
             }
             
-            import httpx
             async with httpx.AsyncClient(timeout=15) as client:
                 response = await client.get(url, params=params)
                 
@@ -1000,17 +1687,22 @@ async def check_verification_status(
                 result = response.json()
                 logger.info(f"Verification status response: {result}")
                 
-                is_complete = result.get("result", "").lower() == "pass"
-                is_error = "error" in result.get("result", "").lower() or "invalid" in result.get("result", "").lower()
+                result_str = result.get("result", "")
+                result_lower = result_str.lower()
+                is_complete = result_lower == "pass"
+                is_error = "error" in result_lower or "invalid" in result_lower
                 
-                return {
+                status = {
                     "success": is_complete,
                     "error": is_error,
-                    "status": result.get("result", "Unknown"),
+                    "status": result_str if "result" in result else "Unknown",
                     "is_complete": is_complete or is_error,
-                    "message": result.get("result", ""),
+                    "message": result_str,
                     "is_blockscout": False
                 }
+                if status["is_complete"]:
+                    _cache_terminal_status(cache_key, status)
+                return status
                 
     except Exception as e:
         logger.error(f"Error checking verification status: {e}", exc_info=True)
@@ -1021,4 +1713,93 @@ async def check_verification_status(
             "is_complete": False
         }
 
-# ... (existing functions: extract_compiler_version, verify_contract_submission, check_verification_status, etc.) ... 
\ No newline at end of file
+
+
+async def poll_until_complete(
+    explorer_base_url: str,
+    guid: str,
+    api_key: str = "",
+    is_blockscout: bool = False,
+    max_attempts: int = 10,
+    poll_interval: int = 5
+) -> Dict[str, Any]:
+    """
+    Poll check_verification_status until the explorer reports a final result.
+    
+    Args:
+        explorer_base_url: Base URL of the explorer API
+        guid: Verification GUID from verification submission
+        api_key: API key for the explorer (for Etherscan-compatible)
+        is_blockscout: Whether the explorer is Blockscout
+        max_attempts: Maximum number of status checks
+        poll_interval: Seconds to wait between status checks
+        
+    Returns:
+        Dict with the last verification status received
+    """
+    status = {}
+    for attempt in range(max_attempts):
+        status = await check_verification_status(
+            explorer_base_url=explorer_base_url,
+            guid=guid,
+            api_key=api_key,
+            is_blockscout=is_blockscout
+        )
+        if status.get("is_complete"):
+            return status
+        if attempt < max_attempts - 1:
+            await asyncio.sleep(poll_interval)
+    
+    logger.warning(f"Verification {guid} still pending after {max_attempts} status checks")
+    return status
+
+
+def _gather_error_result(outcome: Any, message: str) -> Dict[str, Any]:
+    """Turn an exception returned by asyncio.gather into a failed result dict."""
+    if isinstance(outcome, BaseException):
+        logger.error(f"{message}: {outcome}")
+        return {"success": False, "error": True, "message": f"{message}: {outcome}"}
+    return outcome
+
+
+async def verify_many(jobs: List[VerifyJob]) -> List[Dict[str, Any]]:
+    """
+    Submit several contracts for verification concurrently and poll them to completion.
+    
+    Submissions run in a single asyncio.gather, followed by a second gather that polls
+    every accepted submission, so the total wall time is bounded by the slowest explorer
+    rather than the sum of all of them. A failure for one job never aborts the others.
+    
+    Args:
+        jobs: Keyword arguments for verify_contract_submission, one entry per contract
+        
+    Returns:
+        List of verification results in the same order as jobs
+    """
+    submit_outcomes = await asyncio.gather(
+        *(verify_contract_submission(**job) for job in jobs),
+        return_exceptions=True
+    )
+    results = [
+        _gather_error_result(outcome, "Error submitting contract verification")
+        for outcome in submit_outcomes
+    ]
+    
+    pending = [index for index, result in enumerate(results) if result.get("success")]
+    poll_outcomes = await asyncio.gather(
+        *(
+            poll_until_complete(
+                explorer_base_url=jobs[index]["explorer_base_url"],
+                guid=results[index]["guid"],
+                api_key=jobs[index].get("api_key", ""),
+                is_blockscout=jobs[index].get("is_blockscout", False)
+            )
+            for index in pending
+        ),
+        return_exceptions=True
+    )
+    for index, outcome in zip(pending, poll_outcomes):
+        status = _gather_error_result(outcome, "Error checking verification status")
+        results[index] = {**results[index], **status}
+    
+    return results
@@ -1,33 +1,54 @@
 #!/usr/bin/env python3
 
 import os
+import shlex
 import subprocess
-import json
 import shutil
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def run_command(cmd, cwd=None):
-    """Run a command and return the output"""
+def run_command(cmd, cwd=None, stream=False):
+    """Run a command and return the output
+
+    The command is split with shlex and executed directly, without a shell.
+    With stream=True the output is printed line by line as it is produced
+    instead of being buffered, and an empty string is returned on success.
+    """
     print(f"Running command: {cmd}")
-    process = subprocess.Popen(
-        cmd, 
-        shell=True, 
-        stdout=subprocess.PIPE, 
-        stderr=subprocess.PIPE,
-        cwd=cwd
-    )
-    stdout, stderr = process.communicate()
-    
-    if process.returncode != 0:
+    try:
+        if stream:
+            process = subprocess.Popen(
+                shlex.split(cmd),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                cwd=cwd
+            )
+            for line in process.stdout:
+                print(line, end="")
+            process.wait()
+            if process.returncode != 0:
+                print(f"Error executing command: {cmd}")
+                return False
+            return ""
+
+        result = subprocess.run(shlex.split(cmd), capture_output=True, text=True, cwd=cwd)
+    except OSError as e:
         print(f"Error executing command: {cmd}")
-        print(f"Error: {stderr.decode('utf-8')}")
+        print(f"Error: {e}")
         return False
-    
-    return stdout.decode('utf-8')
+
+    if result.returncode != 0:
+        print(f"Error executing command: {cmd}")
+        print(f"Error: {result.stderr}")
+        return False
+
+    return result.stdout
 
 def check_npm_installed():
     """Check if npm is installed"""
-    return run_command("which npm") is not False
+    return shutil.which("npm") is not None
 
 def check_hardhat_installed(contracts_dir):
     """Check if hardhat is installed in the contracts directory"""
@@ -43,54 +64,68 @@ def install_dependencies(contracts_dir):
 def compile_contracts(contracts_dir):
     """Compile the contracts using hardhat"""
     print("Compiling contracts...")
-    result = run_command("npx hardhat compile", cwd=contracts_dir)
+    result = run_command("npx hardhat compile", cwd=contracts_dir, stream=True)
     return result is not False
 
 def find_erc1967_proxy(artifacts_dir):
-    """Find the ERC1967Proxy artifact by walking through the artifacts directory"""
+    """Find the ERC1967Proxy artifact by searching the artifacts directory"""
     print("Searching for ERC1967Proxy.json...")
-    for root, dirs, files in os.walk(artifacts_dir):
-        if "ERC1967Proxy.json" in files:
-            full_path = os.path.join(root, "ERC1967Proxy.json")
-            print(f"Found ERC1967Proxy.json at: {full_path}")
-            return full_path
+    # rglob yields matches lazily, so we stop at the first hit without listing every directory
+    for path in Path(artifacts_dir).rglob("ERC1967Proxy.json"):
+        full_path = str(path)
+        print(f"Found ERC1967Proxy.json at: {full_path}")
+        return full_path
     return None
 
+def _validate_artifact(full_path):
+    """Validate a single artifact file, returning (is_valid, messages) instead of printing"""
+    messages = []
+    if not os.path.exists(full_path):
+        messages.append(f"Artifact not found: {full_path}")
+        return False, messages
+
+    is_valid = True
+    try:
+        with open(full_path, 'rb') as f:
+            artifact = orjson.loads(f.read())
+
+        if not artifact.get('bytecode') or len(artifact['bytecode']) < 200:
+            messages.append(f"Invalid or empty bytecode in {full_path}")
+            messages.append(f"Bytecode length: {len(artifact.get('bytecode', ''))}")
+            is_valid = False
+        else:
+            messages.append(f"Valid artifact: {full_path}")
+            messages.append(f"Bytecode length: {len(artifact.get('bytecode', ''))}")
+
+        # Check for initialize function in ABI
+        if artifact.get('abi'):
+            has_initialize = any(m.get('name') == 'initialize' for m in artifact['abi'])
+            messages.append(f"Has initialize method: {has_initialize}")
+            if not has_initialize:
+                messages.append(f"WARNING: No initialize method found in {full_path}")
+    except Exception as e:
+        messages.append(f"Error checking artifact {full_path}: {e}")
+        is_valid = False
+
+    return is_valid, messages
+
 def check_artifacts(contracts_dir, artifact_paths):
     """Check if artifacts exist and have proper bytecode"""
     print("Checking artifacts...")
-    all_valid = True
-    for artifact_path in artifact_paths:
-        full_path = os.path.join(contracts_dir, artifact_path)
-        
-        if not os.path.exists(full_path):
-            print(f"Artifact not found: {full_path}")
-            all_valid = False
-            continue
-            
-        try:
-            with open(full_path, 'r') as f:
-                artifact = json.load(f)
-                
-            if not artifact.get('bytecode') or len(artifact['bytecode']) < 200:
-                print(f"Invalid or empty bytecode in {full_path}")
-                print(f"Bytecode length: {len(artifact.get('bytecode', ''))}")
-                all_valid = False
-            else:
-                print(f"Valid artifact: {full_path}")
-                print(f"Bytecode length: {len(artifact.get('bytecode', ''))}")
-                
-            # Check for initialize function in ABI
-            if artifact.get('abi'):
-                has_initialize = any(m.get('name') == 'initialize' for m in artifact['abi'] if 'name' in m)
-                print(f"Has initialize method: {has_initialize}")
-                if not has_initialize:
-                    print(f"WARNING: No initialize method found in {full_path}")
-        except Exception as e:
-            print(f"Error checking artifact {full_path}: {e}")
-            all_valid = False
-            
-    return all_valid
+    if not artifact_paths:
+        return True
+
+    full_paths = [os.path.join(contracts_dir, artifact_path) for artifact_path in artifact_paths]
+
+    # Read and parse the artifacts in parallel; output is printed afterwards in the original order
+    with ThreadPoolExecutor(max_workers=min(8, len(full_paths))) as executor:
+        results = list(executor.map(_validate_artifact, full_paths))
+
+    for _, messages in results:
+        for message in messages:
+            print(message)
+
+    return all(is_valid for is_valid, _ in results)
 
 def copy_artifacts_to_deployment_dir(token_contracts_dir, artifacts_dir, erc1967_proxy_path=None):
     """Copy necessary contract artifacts to the deployment directory"""
@@ -122,8 +157,17 @@ def copy_artifacts_to_deployment_dir(token_contracts_dir, artifacts_dir, erc1967
             filename = os.path.basename(src)
             dst = os.path.join(artifacts_dir, filename)
             
+            # Skip the copy when the staged artifact is already up to date (make-style check)
+            if os.path.exists(dst):
+                src_stat = os.stat(src)
+                dst_stat = os.stat(dst)
+                if dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime >= src_stat.st_mtime:
+                    print(f"{filename} is up to date, skipping copy")
+                    continue
+
             print(f"Copying {src} to {dst}")
-            shutil.copy2(src, dst)
+            # copyfile skips the metadata syscalls of copy2 and uses sendfile/copy_file_range on Linux
+            shutil.copyfile(src, dst)
             print(f"Successfully copied {filename}")
             
         return True
@@ -208,8 +252,8 @@ def main():
             "bytecode": "0x608060405260405161010f38038061010f83398101604081905261002291610047565b61002e82826000610035565b505061014c565b61003e83610113565b60008151602083016000f35b60008151905061005c8161013f565b92915050565b60008151905061007181610152565b92915050565b60008060408385031215610089578283fd5b600061009585856100cf565b925060208301356001600160401b038111156100af578283fd5b6100bb85828601610135565b9150509250929050565b60006100cb82610118565b92915050565b60006001600160a01b0382166100cb565b6000610101826100e5565b9392505050565b60006101018260006100f6565b601f19601f83011681019081106001600160401b038211176101d3578283fd5b806000518060209283016000f35b61013881610136565b81525050565b61014881610136565b8082525050565b610165565b6daaaa52656365697074526f6c6c75560941b815260206004820152602260248201527f45524331393637526563656970743a206e6f74206120636f6e747261637400006044820152606401905b60405180910390fd5b6053806101736000396000f3fe6080604052600080fdfea2646970667358221220d33aa0f655a0f50cf5b18a5d05fb2c7cde57f7e3de83a8a36adf24ac80cd6bbb64736f6c63430008040033"
         }
         minimal_proxy_path = os.path.join(backend_artifacts_dir, "ERC1967Proxy.json")
-        with open(minimal_proxy_path, 'w') as f:
-            json.dump(minimal_proxy, f, indent=2)
+        with open(minimal_proxy_path, 'wb') as f:
+            f.write(orjson.dumps(minimal_proxy, option=orjson.OPT_INDENT_2))
         print(f"Created minimal ERC1967Proxy.json at {minimal_proxy_path}")
         
     print("Contracts built and artifacts verified successfully!")
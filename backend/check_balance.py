@@ -4,28 +4,44 @@ import asyncio
 from app.utils.web3_helper import get_account, get_web3
 from app.utils.logger import logger
 
+
 async def check_balance():
     account = get_account()
     if not account:
         print("Failed to load account from private key")
         return
-    
+
     print(f"Deployer address: {account.address}")
-    
-    # Check balance on ZetaChain Testnet
+
     zetachain_web3 = await get_web3(7001)
-    balance = zetachain_web3.eth.get_balance(account.address)
-    print(f"ZetaChain Testnet balance: {balance} wei")
-    print(f"ZetaChain Testnet balance: {zetachain_web3.from_wei(balance, 'ether')} ZETA")
-    
-    # Also check Sepolia
     try:
         sepolia_web3 = await get_web3(11155111)
-        sepolia_balance = sepolia_web3.eth.get_balance(account.address)
-        print(f"Sepolia balance: {sepolia_balance} wei")
-        print(f"Sepolia balance: {sepolia_web3.from_wei(sepolia_balance, 'ether')} ETH")
     except Exception as e:
-        print(f"Failed to check Sepolia balance: {e}")
+        print(f"Failed to connect to Sepolia: {e}")
+        sepolia_web3 = None
+
+    # Query ZetaChain Testnet and Sepolia concurrently rather than one after the other
+    balances = await asyncio.gather(
+        asyncio.to_thread(zetachain_web3.eth.get_balance, account.address),
+        *([asyncio.to_thread(sepolia_web3.eth.get_balance, account.address)] if sepolia_web3 else []),
+        return_exceptions=True
+    )
+
+    balance = balances[0]
+    if isinstance(balance, Exception):
+        print(f"Failed to check ZetaChain Testnet balance: {balance}")
+    else:
+        print(f"ZetaChain Testnet balance: {balance} wei")
+        print(f"ZetaChain Testnet balance: {zetachain_web3.from_wei(balance, 'ether')} ZETA")
+
+    if sepolia_web3:
+        sepolia_balance = balances[1]
+        if isinstance(sepolia_balance, Exception):
+            print(f"Failed to check Sepolia balance: {sepolia_balance}")
+        else:
+            print(f"Sepolia balance: {sepolia_balance} wei")
+            print(f"Sepolia balance: {sepolia_web3.from_wei(sepolia_balance, 'ether')} ETH")
+
 
 if __name__ == "__main__":
-    asyncio.run(check_balance()) 
\ No newline at end of file
+    asyncio.run(check_balance())
\ No newline at end of file
@@ -15,6 +15,7 @@ from app.utils.web3_helper import (
     get_web3, 
     get_account, 
     _load_artifact,
+    multicall_view_functions,
     ZC_TOKEN_PATH
 )
 from app.utils.logger import logger
@@ -55,51 +56,52 @@ async def check_contract():
     # Try to call various view functions to see contract state
     logger.info("Checking contract state...")
     
+    # Index the ABI functions by name once instead of rescanning the ABI for every lookup
+    fn_index = {
+        item['name']: item
+        for item in token_abi
+        if isinstance(item, dict) and item.get('type') == 'function'
+    }
+    
     # Find all view/pure functions in ABI
-    view_functions = []
-    for item in token_abi:
-        if isinstance(item, dict) and item.get('type') == 'function':
-            if item.get('stateMutability') in ['view', 'pure']:
-                view_functions.append(item.get('name'))
+    view_functions = [
+        name for name, item in fn_index.items()
+        if item.get('stateMutability') in ('view', 'pure')
+    ]
     
     logger.info(f"Found {len(view_functions)} view functions in ABI")
     
-    # Call each view function to check state
+    # Skip functions with arguments
+    callable_functions = []
     for func_name in view_functions:
-        try:
-            if hasattr(contract.functions, func_name) and callable(getattr(contract.functions, func_name)):
-                func = getattr(contract.functions, func_name)
-                
-                # Skip functions with arguments
-                signature = None
-                for item in token_abi:
-                    if isinstance(item, dict) and item.get('type') == 'function' and item.get('name') == func_name:
-                        signature = item
-                        break
-                
-                if signature and len(signature.get('inputs', [])) > 0:
-                    logger.info(f"Skipping {func_name}() - requires arguments")
-                    continue
-                
-                result = func().call()
-                logger.info(f"{func_name}() => {result}")
-        except Exception as e:
-            logger.error(f"Error calling {func_name}(): {e}")
+        if fn_index[func_name].get('inputs'):
+            logger.info(f"Skipping {func_name}() - requires arguments")
+            continue
+        callable_functions.append(func_name)
+    
+    # Read all view functions in a single eth_call through Multicall3
+    results = multicall_view_functions(web3, contract, callable_functions)
+    for func_name in callable_functions:
+        result = results.get(func_name)
+        if isinstance(result, Exception):
+            logger.error(f"Error calling {func_name}(): {result}")
+        else:
+            logger.info(f"{func_name}() => {result}")
     
     # Check for initialize function and its parameters
-    for item in token_abi:
-        if isinstance(item, dict) and item.get('type') == 'function' and item.get('name') == 'initialize':
-            logger.info("Found initialize function in ABI:")
-            inputs = item.get('inputs', [])
-            for idx, inp in enumerate(inputs):
-                logger.info(f"  Parameter {idx}: {inp.get('name')} ({inp.get('type')})")
+    initialize_abi = fn_index.get('initialize')
+    if initialize_abi:
+        logger.info("Found initialize function in ABI:")
+        inputs = initialize_abi.get('inputs', [])
+        for idx, inp in enumerate(inputs):
+            logger.info(f"  Parameter {idx}: {inp.get('name')} ({inp.get('type')})")
     
     # Check for initialization status (common pattern in upgradeable contracts)
     try:
-        if hasattr(contract.functions, 'initialized'):
+        if 'initialized' in fn_index:
             initialized = contract.functions.initialized().call()
             logger.info(f"initialized() => {initialized}")
-        elif hasattr(contract.functions, '_initialized'):
+        elif '_initialized' in fn_index:
             initialized = contract.functions._initialized().call()
             logger.info(f"_initialized() => {initialized}")
         else:
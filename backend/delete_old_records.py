@@ -34,40 +34,42 @@ print("Connecting to database...")
 # Create database engine
 engine = create_engine(db_url)
 
-# SQL query to delete all records except the 2 most recent ones
+# Number of most recent records to keep
+KEEP_RECORDS = 2
+
+# Delete everything outside the keep-set in one statement. The keep-set is read
+# through ix_token_deployments_created_at_id and NOT EXISTS avoids the NOT IN
+# subquery materialization (and its NULL pitfall).
 sql = """
-DELETE FROM token_deployments 
-WHERE id NOT IN (
-    SELECT id 
-    FROM token_deployments 
-    ORDER BY created_at DESC, id DESC 
-    LIMIT 1
-);
+WITH keep AS (
+    SELECT id
+    FROM token_deployments
+    ORDER BY created_at DESC, id DESC
+    LIMIT :keep
+)
+DELETE FROM token_deployments t
+WHERE NOT EXISTS (SELECT 1 FROM keep k WHERE k.id = t.id)
+RETURNING t.id;
 """
 
 # Execute the query
 try:
     with engine.connect() as conn:
-        # First, let's get the total count
-        total = conn.execute(text("SELECT COUNT(*) FROM token_deployments")).scalar()
-        print(f"Total records before deletion: {total}")
-        
         # Execute the delete query
-        result = conn.execute(text(sql)).rowcount
+        deleted_ids = conn.execute(text(sql), {"keep": KEEP_RECORDS}).scalars().all()
         
         # Commit the transaction
         conn.commit()
         
-        # Get the remaining count
-        remaining = conn.execute(text("SELECT COUNT(*) FROM token_deployments")).scalar()
-        
-        print(f"Deleted {result} records")
-        print(f"Remaining records: {remaining}")
-        
         # Show the remaining records
         records = conn.execute(text(
             "SELECT id, token_name, created_at FROM token_deployments ORDER BY created_at DESC"
-        ))
+        )).all()
+        
+        print(f"Total records before deletion: {len(deleted_ids) + len(records)}")
+        print(f"Deleted {len(deleted_ids)} records")
+        print(f"Remaining records: {len(records)}")
+        
         print("\nRemaining token records:")
         for record in records:
             print(f"ID: {record.id}, Name: {record.token_name}, "
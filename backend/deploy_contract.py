@@ -1,6 +1,9 @@
+import asyncio
 import json
 import os
-from web3 import Web3
+from concurrent.futures import ThreadPoolExecutor
+from web3 import AsyncWeb3, Web3, WebsocketProviderV2
+from web3.exceptions import TransactionNotFound
 from dotenv import load_dotenv
 import argparse
 
@@ -8,65 +11,140 @@ import argparse
 # Load environment variables
 load_dotenv()
 
+from app.utils.web3_helper import compute_create_address, raw_transaction_bytes
 
-def deploy_contract(w3, artifact_path, constructor_args=None, private_key=None):
+
+async def _wait_for_receipts_on_new_heads(w3, ws_url, tx_hashes, timeout=120):
+    """Check for receipts each time a new block arrives on a newHeads subscription"""
+    receipts = {}
+
+    def collect():
+        for tx_hash in tx_hashes:
+            if tx_hash not in receipts:
+                try:
+                    receipts[tx_hash] = w3.eth.get_transaction_receipt(tx_hash)
+                except TransactionNotFound:
+                    pass
+        return len(receipts) == len(tx_hashes)
+
+    async with AsyncWeb3.persistent_websocket(WebsocketProviderV2(ws_url)) as ws_w3:
+        await ws_w3.eth.subscribe('newHeads')
+        # The transactions may already have been mined before the subscription started
+        if not collect():
+            async with asyncio.timeout(timeout):
+                async for _ in ws_w3.ws.listen_to_websocket():
+                    if collect():
+                        break
+
+    return [receipts[tx_hash] for tx_hash in tx_hashes]
+
+
+def wait_for_receipts(w3, tx_hashes, ws_url=None):
     """
-    Deploy a contract using the compiled artifact
+    Wait for the receipts of several transactions
+    
+    With a websocket URL, receipts are checked only when a new block is announced,
+    sharing one newHeads subscription for all transactions. Otherwise (or if the
+    subscription fails) the receipts are polled over HTTP in parallel.
     
     Args:
         w3: Web3 instance
-        artifact_path: Path to the compiled contract JSON file
-        constructor_args: Arguments for the contract constructor
-        private_key: Private key to sign the transaction
+        tx_hashes: Transaction hashes to wait for
+        ws_url: Optional websocket RPC URL
         
     Returns:
-        Deployed contract address
+        List of transaction receipts, in the order of tx_hashes
     """
-    # Load contract ABI and bytecode
-    with open(artifact_path, 'r') as f:
-        contract_json = json.load(f)
-    
-    abi = contract_json['abi']
-    bytecode = contract_json['bytecode']
+    if ws_url:
+        try:
+            return asyncio.run(_wait_for_receipts_on_new_heads(w3, ws_url, tx_hashes))
+        except Exception as e:
+            print(f"newHeads subscription failed ({e}), falling back to polling")
+
+    with ThreadPoolExecutor(max_workers=len(tx_hashes) or 1) as executor:
+        return list(executor.map(w3.eth.wait_for_transaction_receipt, tx_hashes))
+
+
+def deploy_many(w3, jobs, private_key=None, ws_url=None):
+    """
+    Deploy several contracts in one go, sharing the setup RPC calls
     
-    # Get contract factory
-    contract = w3.eth.contract(abi=abi, bytecode=bytecode)
+    Gas price and nonce are fetched once and the nonce is incremented locally.
+    All transactions are signed and sent before waiting, and the receipts are
+    awaited in parallel. Contract addresses are derived from the nonce up front,
+    so a job may depend on the address of an earlier job.
     
-    # Get transaction parameters
+    Args:
+        w3: Web3 instance
+        jobs: List of (artifact_path, constructor_args) tuples. constructor_args
+            may be a callable that receives the addresses of the preceding jobs
+        private_key: Private key to sign the transactions
+        ws_url: Optional websocket RPC URL used to wait for receipts on new blocks
+        
+    Returns:
+        List of deployed contract addresses, in job order
+    """
     account = w3.eth.account.from_key(private_key)
     nonce = w3.eth.get_transaction_count(account.address)
-    
-    # Build transaction
-    if constructor_args:
-        contract_txn = contract.constructor(*constructor_args).build_transaction({
-            'from': account.address,
-            'nonce': nonce,
-            'gas': 3000000,
-            'gasPrice': w3.eth.gas_price
-        })
-    else:
-        contract_txn = contract.constructor().build_transaction({
+    gas_price = w3.eth.gas_price
+    
+    artifacts = {}
+    addresses = []
+    tx_hashes = []
+    for artifact_path, constructor_args in jobs:
+        # Load contract ABI and bytecode once per artifact
+        if artifact_path not in artifacts:
+            with open(artifact_path, 'r') as f:
+                contract_json = json.load(f)
+            artifacts[artifact_path] = w3.eth.contract(abi=contract_json['abi'], bytecode=contract_json['bytecode'])
+        contract = artifacts[artifact_path]
+        
+        if callable(constructor_args):
+            constructor_args = constructor_args(list(addresses))
+        
+        # Build transaction
+        contract_txn = contract.constructor(*(constructor_args or [])).build_transaction({
             'from': account.address,
             'nonce': nonce,
             'gas': 3000000,
-            'gasPrice': w3.eth.gas_price
+            'gasPrice': gas_price
         })
+        
+        # Sign and send transaction
+        signed_txn = w3.eth.account.sign_transaction(contract_txn, private_key=private_key)
+        tx_hashes.append(w3.eth.send_raw_transaction(raw_transaction_bytes(signed_txn)))
+        addresses.append(compute_create_address(account.address, nonce))
+        nonce += 1
     
-    # Sign transaction
-    signed_txn = w3.eth.account.sign_transaction(contract_txn, private_key=private_key)
+    receipts = wait_for_receipts(w3, tx_hashes, ws_url=ws_url)
     
-    # Send transaction
-    tx_hash = w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+    for (artifact_path, _), receipt in zip(jobs, receipts):
+        if receipt.status != 1:
+            raise RuntimeError(f"Deployment of {artifact_path} reverted (tx {receipt.transactionHash.hex()})")
     
-    # Wait for transaction receipt
-    tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+    return [receipt.contractAddress for receipt in receipts]
+
+
+def deploy_contract(w3, artifact_path, constructor_args=None, private_key=None):
+    """
+    Deploy a contract using the compiled artifact
     
-    return tx_receipt.contractAddress
+    Args:
+        w3: Web3 instance
+        artifact_path: Path to the compiled contract JSON file
+        constructor_args: Arguments for the contract constructor
+        private_key: Private key to sign the transaction
+        
+    Returns:
+        Deployed contract address
+    """
+    return deploy_many(w3, [(artifact_path, constructor_args)], private_key=private_key)[0]
 
 
 def main():
     parser = argparse.ArgumentParser(description='Deploy contracts to Zetachain testnet')
     parser.add_argument('--rpc', default='https://zetachain-athens.g.allthatnode.com/archive/evm', help='RPC URL')
+    parser.add_argument('--ws', default=os.getenv('WS_RPC_URL'), help='Websocket RPC URL used to wait for receipts')
     args = parser.parse_args()
     
     # Connect to Zetachain testnet
@@ -87,28 +165,23 @@ def main():
     if not private_key:
         private_key = input("Enter your private key: ")
     
-    # Deploy main contract
-    print("Deploying ZetaChainUniversalToken...")
-    token_address = deploy_contract(
-        w3,
-        'artifacts/ZetaChainUniversalToken.json',
-        constructor_args=None,
-        private_key=private_key
-    )
-    print(f"ZetaChainUniversalToken deployed at: {token_address}")
-    
-    # Deploy proxy
-    print("Deploying ERC1967Proxy...")
+    # Deploy the token and its proxy together. The proxy needs the implementation address,
+    # which is known from the nonce before the token deployment is mined.
+    print("Deploying ZetaChainUniversalToken and ERC1967Proxy...")
     
     # For the proxy, we typically need the implementation address and initialization data
     # Note: This depends on your exact proxy setup, and might need adjustment
     # Assuming we need to initialize with the token address
-    proxy_address = deploy_contract(
+    token_address, proxy_address = deploy_many(
         w3,
-        'artifacts/ERC1967Proxy.json',
-        constructor_args=[token_address, b''],  # Adjust initialization data as needed
-        private_key=private_key
+        [
+            ('artifacts/ZetaChainUniversalToken.json', None),
+            ('artifacts/ERC1967Proxy.json', lambda addresses: [addresses[0], b'']),  # Adjust initialization data as needed
+        ],
+        private_key=private_key,
+        ws_url=args.ws
     )
+    print(f"ZetaChainUniversalToken deployed at: {token_address}")
     print(f"ERC1967Proxy deployed at: {proxy_address}")
     print(f"Your token is now accessible through the proxy at: {proxy_address}")
 
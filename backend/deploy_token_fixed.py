@@ -1,14 +1,15 @@
 #!/usr/bin/env python3
 
 import asyncio
-import json
+import orjson
 import os
 import sys
-import time
 import datetime
 from datetime import datetime as dt
 from dotenv import load_dotenv
+from pathlib import Path
 from hexbytes import HexBytes
+from web3 import Web3
 
 # Load environment variables
 load_dotenv()
@@ -18,98 +19,94 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.utils.web3_helper import (
     get_web3, 
+    get_async_web3,
     get_account, 
+    wait_for_code,
     _load_artifact,
-    deploy_token_direct,
-    call_contract_method,
+    raw_transaction_bytes,
+    abi_function_names,
+    compute_create_address,
+    encode_raw_call,
+    fetch_tx_params,
+    load_bytecode_bytes,
+    sign_raw_call,
+    send_raw_call,
+    multicall_view_functions,
+    multicall_result,
     EVM_TOKEN_PATH,
     ZC_TOKEN_PATH
 )
-from app.utils.logger import logger
+from app.utils.logger import logger, LOG_LEVEL
 from app.utils.chain_config import get_chain_config
 
 # Configuration
 current_time = dt.now().strftime("%H%M%S")
 TOKEN_NAME = f"Universal Token {current_time}"
 TOKEN_SYMBOL = f"UT{current_time}"
-# Use the first argument as chain ID if provided, or default to ZetaChain
-CHAIN_ID = sys.argv[1] if len(sys.argv) > 1 else "7001"
+# Chain IDs to deploy to are taken from the arguments, defaulting to ZetaChain
+CHAIN_IDS = sys.argv[1:] or ["7001"]
 
-async def deploy_token():
-    """Deploy a token contract with the fixed approach"""
-    logger.info(f"Deploying token on chain {CHAIN_ID} using fixed approach")
+# Parameter types and selectors for the calls sent with send_raw_call
+ZC_INITIALIZE_TYPES = ["address", "string", "string", "address", "uint256", "address"]
+EVM_INITIALIZE_TYPES = ["address", "string", "string", "address", "uint256"]
+MINT_TYPES = ["address", "uint256"]
+SELECTOR_ZC_INITIALIZE = bytes.fromhex("650b4f8b")   # initialize(address,string,string,address,uint256,address)
+SELECTOR_EVM_INITIALIZE = bytes.fromhex("75b30be6")  # initialize(address,string,string,address,uint256)
+SELECTOR_MINT = bytes.fromhex("40c10f19")            # mint(address,uint256)
+
+if __debug__:
+    assert Web3.keccak(text=f"initialize({','.join(ZC_INITIALIZE_TYPES)})")[:4] == SELECTOR_ZC_INITIALIZE
+    assert Web3.keccak(text=f"initialize({','.join(EVM_INITIALIZE_TYPES)})")[:4] == SELECTOR_EVM_INITIALIZE
+    assert Web3.keccak(text=f"mint({','.join(MINT_TYPES)})")[:4] == SELECTOR_MINT
+
+async def deploy_token(chain_id):
+    """Deploy a token contract with the fixed approach on a single chain"""
+    logger.info(f"Deploying token on chain {chain_id} using fixed approach")
     
     # Get Web3 instance and account
-    web3 = await get_web3(int(CHAIN_ID))
+    web3 = await get_web3(int(chain_id))
     account = get_account()
     
     if not web3 or not account:
         logger.error("Failed to get web3 or account")
         return False
     
+    # LocalAccount addresses are already checksummed
+    owner_address = account.address
+    
     # Load the appropriate token artifacts
-    artifact_path = ZC_TOKEN_PATH if CHAIN_ID == "7001" else EVM_TOKEN_PATH
-    token_abi, token_bytecode = _load_artifact(artifact_path)
+    artifact_path = ZC_TOKEN_PATH if chain_id == "7001" else EVM_TOKEN_PATH
+    token_abi, _ = _load_artifact(artifact_path)
+    # Raw bytes go straight into the deploy transaction without further hex round-trips
+    token_bytecode = load_bytecode_bytes(artifact_path)
     
     if not token_abi or not token_bytecode:
         logger.error(f"Failed to load token artifacts from {artifact_path}")
         return False
         
     # Get chain configuration
-    chain_config = get_chain_config(int(CHAIN_ID))
+    chain_config = get_chain_config(int(chain_id))
     if not chain_config:
-        logger.error(f"Chain config not found for chain ID: {CHAIN_ID}")
+        logger.error(f"Chain config not found for chain ID: {chain_id}")
         return False
     
     gateway_address = chain_config.get("gateway_address")
     if not gateway_address:
-        logger.error(f"Gateway address not found for chain ID: {CHAIN_ID}")
+        logger.error(f"Gateway address not found for chain ID: {chain_id}")
         return False
     
     # Only ZetaChain needs the uniswap router address
     uniswap_router_address = None
-    if CHAIN_ID == "7001":  # ZetaChain
+    if chain_id == "7001":  # ZetaChain
         uniswap_router_address = chain_config.get("uniswap_router_address")
         if not uniswap_router_address:
             uniswap_router_address = "0x2ca7d64A7EFE2D62A725E2B35Cf7230D6677FfEe"  # Default for testnet
             logger.warning(f"Using default Uniswap router address: {uniswap_router_address}")
     
-    # Step 1: Deploy token with no constructor arguments
-    logger.info("Step 1: Deploying token contract with NO constructor arguments")
-    deploy_result = await deploy_token_direct(
-        web3=web3,
-        account=account,
-        contract_abi=token_abi,
-        contract_bytecode=token_bytecode,
-        gas_limit_override=8000000  # Higher gas limit for safety
-    )
-    
-    if not deploy_result.get("success"):
-        logger.error(f"Failed to deploy token: {deploy_result.get('message')}")
-        return False
-    
-    contract_address = deploy_result.get("contract_address")
-    logger.info(f"Token deployed successfully at: {contract_address}")
-    
-    # Wait a bit to ensure contract deployment is fully propagated
-    logger.info("Waiting 5 seconds for deployment to propagate...")
-    time.sleep(5)
-    
-    # Step 2: Verify contract exists with code
-    logger.info("Step 2: Verifying contract has code")
-    code = web3.eth.get_code(contract_address)
-    if not code or code == '0x' or code == b'0x':
-        logger.error(f"No code found at address {contract_address}!")
-        return False
-    
-    logger.info(f"Contract verified! Code size: {len(code)} bytes")
-    
-    # Step 3: Initialize the deployed contract
-    logger.info("Step 3: Initializing the contract with token parameters")
-    
-    # Prepare initialization arguments based on chain type
+    # Step 1: Prepare initialization arguments based on chain type
+    logger.info("Step 1: Preparing initialize arguments")
     init_args = []
-    if CHAIN_ID == "7001":  # ZetaChain (6 params)
+    if chain_id == "7001":  # ZetaChain (6 params)
         # Try with different parameter handling for ZetaChain
         try:
             # Use raw addresses for gateway and router (don't checksum)
@@ -122,7 +119,7 @@ async def deploy_token():
             
             # For ZetaChain, try with raw addresses (not checksummed)
             init_args = [
-                web3.to_checksum_address(account.address),  # initialOwner (regular address)
+                owner_address,                             # initialOwner (regular address)
                 TOKEN_NAME,                                # name
                 TOKEN_SYMBOL,                              # symbol
                 gateway_raw,                               # gatewayAddress (raw address)
@@ -146,7 +143,7 @@ async def deploy_token():
             logger.info(f"Checksummed gateway address: {checksummed_gateway}")
             
             init_args = [
-                web3.to_checksum_address(account.address),  # initialOwner
+                owner_address,                             # initialOwner
                 TOKEN_NAME,                                # name
                 TOKEN_SYMBOL,                              # symbol
                 checksummed_gateway,                       # gatewayAddress (use checksummed)
@@ -161,65 +158,157 @@ async def deploy_token():
     for i, arg in enumerate(init_args):
         logger.info(f"  Initialize arg {i}: {arg}")
     
-    # Call initialize with detailed debugging
-    logger.info(f"Calling initialize on {contract_address} with {len(init_args)} arguments")
+    is_zetachain = chain_id == "7001"
+    init_selector = SELECTOR_ZC_INITIALIZE if is_zetachain else SELECTOR_EVM_INITIALIZE
+    init_types = ZC_INITIALIZE_TYPES if is_zetachain else EVM_INITIALIZE_TYPES
+    
+    # Cross-check the raw calldata against web3's own encoding before anything is
+    # signed, only when debugging. web3 only accepts checksummed addresses, which
+    # ABI-encode to the same bytes as the raw ones.
+    if LOG_LEVEL == "DEBUG":
+        checksummed_args = [
+            Web3.to_checksum_address(arg) if param_type == "address" else arg
+            for arg, param_type in zip(init_args, init_types)
+        ]
+        web3_calldata = HexBytes(web3.eth.contract(abi=token_abi).encodeABI(fn_name="initialize", args=checksummed_args))
+        raw_calldata = encode_raw_call(init_selector, init_types, init_args)
+        assert web3_calldata == raw_calldata, (
+            f"initialize calldata mismatch: web3 {web3_calldata.hex()} != raw {raw_calldata.hex()}"
+        )
+        logger.debug(f"Initialize calldata matches web3's encoding: {raw_calldata.hex()[:100]}...")
     
-    # Try to encode the initialization data manually to verify it
-    contract = web3.eth.contract(address=contract_address, abi=token_abi)
+    # Step 2: Deploy and initialize in one pipeline. The CREATE address follows from
+    # (sender, nonce), so initialize can be signed with the next nonce and broadcast
+    # right behind the deploy transaction instead of waiting for its receipt.
+    logger.info("Step 2: Deploying token contract with NO constructor arguments and initializing it")
     try:
-        encoded_data = contract.encodeABI(fn_name="initialize", args=init_args)
-        logger.info(f"Encoded initialize data: {encoded_data[:100]}...")
-    except Exception as encode_err:
-        logger.error(f"Error encoding initialize data: {encode_err}")
-        # Continue with the call anyway
-    
-    init_result = await call_contract_method(
-        web3=web3,
-        account=account,
-        contract_address=contract_address,
-        contract_abi=token_abi,
-        method_name="initialize",
-        args=init_args,
-        gas_limit=8000000  # Higher gas limit for safety
+        gas_price, nonce, tx_chain_id = await fetch_tx_params(web3, owner_address)
+        deploy_raw = raw_transaction_bytes(account.sign_transaction({
+            'from': owner_address,
+            'nonce': nonce,
+            'gas': 8000000,  # Higher gas limit for safety
+            'gasPrice': gas_price,
+            'chainId': tx_chain_id,
+            'value': 0,
+            'data': token_bytecode
+        }))
+        contract_address = compute_create_address(owner_address, nonce)
+        init_raw = sign_raw_call(
+            account,
+            contract_address,
+            init_selector,
+            init_types,
+            init_args,
+            gas=8000000,  # Higher gas limit for safety
+            gas_price=gas_price,
+            nonce=nonce + 1,
+            chain_id=tx_chain_id
+        )
+        
+        deploy_hash = web3.eth.send_raw_transaction(deploy_raw)
+    except Exception as e:
+        logger.error(f"Failed to deploy token: {e}")
+        return False
+    
+    # The deploy is already broadcast at this point; if initialize can't be sent,
+    # report the contract that was left uninitialized instead of a failed deploy
+    try:
+        init_hash = web3.eth.send_raw_transaction(init_raw)
+    except Exception as e:
+        logger.error(f"Failed to send initialize transaction: {e}")
+        logger.error("Deployment incomplete - contract deployed but not initialized!")
+        logger.info(f"Deployed contract address: {contract_address}")
+        logger.info(f"Deploy transaction hash: {web3.to_hex(deploy_hash)}")
+        
+        # Save partial deployment info anyway for debugging
+        await asyncio.to_thread(save_deployment_info, chain_id, contract_address, account.address, "failed_init")
+        return False
+    
+    logger.info(f"Deploy tx {web3.to_hex(deploy_hash)} and initialize tx {web3.to_hex(init_hash)} sent")
+    logger.info(f"Calling initialize on {contract_address} with {len(init_args)} arguments")
+    
+    deploy_receipt, init_receipt = await asyncio.gather(
+        asyncio.to_thread(web3.eth.wait_for_transaction_receipt, deploy_hash, timeout=120),
+        asyncio.to_thread(web3.eth.wait_for_transaction_receipt, init_hash, timeout=120),
+        return_exceptions=True
     )
     
-    if not init_result.get("success"):
-        logger.error(f"Contract initialization failed: {init_result.get('message')}")
+    if isinstance(deploy_receipt, Exception) or deploy_receipt.status != 1:
+        logger.error(f"Failed to deploy token: {deploy_receipt if isinstance(deploy_receipt, Exception) else 'transaction reverted'}")
+        return False
+    
+    logger.info(f"Token deployed successfully at: {contract_address}")
+    
+    # Step 3: Verify contract exists with code (a call to an address without code would "succeed")
+    logger.info("Step 3: Verifying contract has code")
+    async_web3 = await get_async_web3(int(chain_id))
+    code = await wait_for_code(async_web3, contract_address, timeout=5)
+    if not code:
+        logger.error(f"No code found at address {contract_address}!")
+        return False
+    
+    logger.info(f"Contract verified! Code size: {len(code)} bytes")
+    
+    # Build the contract object once; it is reused for all later reads
+    contract = web3.eth.contract(address=contract_address, abi=token_abi)
+    
+    if isinstance(init_receipt, Exception) or init_receipt.status != 1:
+        message = init_receipt if isinstance(init_receipt, Exception) else "Transaction reverted"
+        logger.error(f"Contract initialization failed: {message}")
         logger.error("Deployment incomplete - contract exists but not initialized!")
-        
-        # Check if there's a transaction hash
-        tx_hash = init_result.get("transaction_hash")
-        if tx_hash:
-            logger.info(f"Failed initialization transaction hash: {tx_hash}")
-            try:
-                receipt = init_result.get("receipt")
-                logger.info(f"Gas used: {receipt.get('gasUsed', 'unknown')}")
-            except:
-                pass
+        logger.info(f"Failed initialization transaction hash: {web3.to_hex(init_hash)}")
+        if not isinstance(init_receipt, Exception):
+            logger.info(f"Gas used: {init_receipt.get('gasUsed', 'unknown')}")
         
         # Save partial deployment info anyway for debugging
-        save_deployment_info(contract_address, account.address, "failed_init")
+        await asyncio.to_thread(save_deployment_info, chain_id, contract_address, account.address, "failed_init")
         return False
     
     logger.info("Contract initialized successfully!")
     
+    # Steps 4 and 5 only depend on initialize having succeeded, so the verification
+    # reads run in a worker thread while the mint transaction is being confirmed
+    await asyncio.gather(
+        asyncio.to_thread(
+            verify_contract_state,
+            web3, contract, chain_id, token_abi, owner_address, gateway_address, uniswap_router_address
+        ),
+        mint_initial_supply(web3, account, contract)
+    )
+    
+    # Save deployment information
+    await asyncio.to_thread(save_deployment_info, chain_id, contract_address, account.address, "success")
+    
+    logger.info("Deployment and initialization complete!")
+    return True
+
+def verify_contract_state(web3, contract, chain_id, token_abi, owner_address, gateway_address, uniswap_router_address):
+    """Check the token's state after initialization, logging any mismatches"""
     # Step 4: Verify initialization worked by checking contract data
     logger.info("Step 4: Verifying contract initialization")
     
-    contract = web3.eth.contract(address=contract_address, abi=token_abi)
+    # Fetch every value checked below in a single round-trip
+    view_names = ["owner", "name", "symbol"]
+    if chain_id == "7001":
+        token_functions = abi_function_names(token_abi)
+        view_names += [
+            fn for fn in ("gatewayAddress", "gas", "uniswapRouterAddress")
+            if fn in token_functions
+        ]
+    state = multicall_view_functions(web3, contract, view_names)
     
     try:
-        owner = contract.functions.owner().call()
-        name = contract.functions.name().call()
-        symbol = contract.functions.symbol().call()
+        owner = multicall_result(state, "owner")
+        name = multicall_result(state, "name")
+        symbol = multicall_result(state, "symbol")
         
         logger.info(f"Contract data:")
         logger.info(f"  Owner: {owner}")
         logger.info(f"  Name: {name}")
         logger.info(f"  Symbol: {symbol}")
         
-        if owner.lower() != account.address.lower():
-            logger.warning(f"Owner mismatch! Expected: {account.address}, Got: {owner}")
+        if owner.lower() != owner_address.lower():
+            logger.warning(f"Owner mismatch! Expected: {owner_address}, Got: {owner}")
         
         if name != TOKEN_NAME:
             logger.warning(f"Name mismatch! Expected: {TOKEN_NAME}, Got: {name}")
@@ -230,12 +319,12 @@ async def deploy_token():
         logger.error(f"Error checking contract data: {e}")
     
     # Add ZetaChain specific verification for contract
-    if CHAIN_ID == "7001":
+    if chain_id == "7001":
         logger.info("Checking ZetaChain-specific contract properties:")
         try:
             # Check gateway address
-            if hasattr(contract.functions, 'gatewayAddress'):
-                gateway = contract.functions.gatewayAddress().call()
+            if 'gatewayAddress' in state:
+                gateway = multicall_result(state, "gatewayAddress")
                 logger.info(f"Contract gateway address: {gateway}")
                 if gateway.lower() != gateway_address.lower():
                     logger.warning(f"Gateway address mismatch! Expected: {gateway_address}, Got: {gateway}")
@@ -243,15 +332,15 @@ async def deploy_token():
                 logger.info("Contract does not have gatewayAddress() method")
                 
             # Check gas limit
-            if hasattr(contract.functions, 'gas'):
-                gas_limit = contract.functions.gas().call()
+            if 'gas' in state:
+                gas_limit = multicall_result(state, "gas")
                 logger.info(f"Contract gas limit: {gas_limit}")
             else:
                 logger.info("Contract does not have gas() method")
                 
             # Check router address
-            if hasattr(contract.functions, 'uniswapRouterAddress'):
-                router = contract.functions.uniswapRouterAddress().call()
+            if 'uniswapRouterAddress' in state:
+                router = multicall_result(state, "uniswapRouterAddress")
                 logger.info(f"Contract uniswap router: {router}")
                 if router.lower() != uniswap_router_address.lower():
                     logger.warning(f"Router address mismatch! Expected: {uniswap_router_address}, Got: {router}")
@@ -259,7 +348,9 @@ async def deploy_token():
                 logger.info("Contract does not have uniswapRouterAddress() method")
         except Exception as e:
             logger.error(f"Error checking ZetaChain-specific properties: {e}")
-    
+
+async def mint_initial_supply(web3, account, contract):
+    """Mint the initial token supply to the deployer and log the resulting balance"""
     # Step 5: Try to mint some tokens
     logger.info("Step 5: Minting initial token supply")
     
@@ -267,14 +358,14 @@ async def deploy_token():
         # Amount to mint (1 million tokens with 18 decimals)
         amount = web3.to_wei(1000000, "ether")
         
-        mint_result = await call_contract_method(
+        mint_result = await send_raw_call(
             web3=web3,
             account=account,
-            contract_address=contract_address,
-            contract_abi=token_abi,
-            method_name="mint",
-            args=[account.address, amount],
-            gas_limit=5000000
+            to=contract.address,
+            selector=SELECTOR_MINT,
+            param_types=MINT_TYPES,
+            params=[account.address, amount],
+            gas=5000000
         )
         
         if mint_result.get("success"):
@@ -287,18 +378,12 @@ async def deploy_token():
             logger.error(f"Minting failed: {mint_result.get('message')}")
     except Exception as e:
         logger.error(f"Error minting tokens: {e}")
-    
-    # Save deployment information
-    save_deployment_info(contract_address, account.address, "success")
-    
-    logger.info("Deployment and initialization complete!")
-    return True
 
-def save_deployment_info(contract_address, deployer, status):
+def save_deployment_info(chain_id, contract_address, deployer, status):
     """Save deployment information to a JSON file"""
     timestamp = dt.now().strftime("%Y%m%d_%H%M%S")
     deployment_info = {
-        "chain_id": CHAIN_ID,
+        "chain_id": chain_id,
         "contract_address": contract_address,
         "token_name": TOKEN_NAME,
         "token_symbol": TOKEN_SYMBOL,
@@ -307,26 +392,35 @@ def save_deployment_info(contract_address, deployer, status):
         "status": status
     }
     
-    filename = f"fixed_deployment_{CHAIN_ID}_{timestamp}.json"
-    with open(filename, "w") as f:
-        json.dump(deployment_info, f, indent=2)
+    filename = f"fixed_deployment_{chain_id}_{timestamp}.json"
+    Path(filename).write_bytes(orjson.dumps(deployment_info, option=orjson.OPT_INDENT_2))
     
     logger.info(f"Deployment info saved to {filename}")
 
 async def main():
-    """Main function to run the deployment"""
-    logger.info("Starting Fixed Token Deployment")
-    
-    # Deploy token
-    success = await deploy_token()
+    """Main function to run the deployment on every requested chain"""
+    logger.info(f"Starting Fixed Token Deployment on chains: {', '.join(CHAIN_IDS)}")
+    
+    # Each chain gets its own thread and event loop, since the sync web3 calls
+    # would otherwise block the shared loop and serialize the deployments
+    results = await asyncio.gather(
+        *(asyncio.to_thread(asyncio.run, deploy_token(chain_id)) for chain_id in CHAIN_IDS),
+        return_exceptions=True
+    )
     
-    if success:
-        logger.info("Deployment completed successfully!")
-    else:
-        logger.error("Deployment failed!")
+    success = True
+    for chain_id, result in zip(CHAIN_IDS, results):
+        if isinstance(result, Exception):
+            logger.error(f"Deployment on chain {chain_id} raised an error: {result}")
+            success = False
+        elif result:
+            logger.info(f"Deployment on chain {chain_id} completed successfully!")
+        else:
+            logger.error(f"Deployment on chain {chain_id} failed!")
+            success = False
     
     return success
 
 if __name__ == "__main__":
     success = asyncio.run(main())
-    exit(0 if success else 1) 
\ No newline at end of file
+    exit(0 if success else 1)
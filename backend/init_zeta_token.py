@@ -4,9 +4,8 @@ import asyncio
 import json
 import os
 import sys
-import eth_abi
 from web3 import Web3
-from eth_utils import to_checksum_address, remove_0x_prefix, to_hex
+from eth_utils import to_checksum_address
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -19,17 +18,34 @@ from app.utils.web3_helper import (
     get_web3, 
     get_account, 
     _load_artifact,
+    index_abi,
+    multicall_view_functions,
+    multicall_result,
+    send_raw_call,
     ZC_TOKEN_PATH
 )
 from app.utils.logger import logger
 
 # Configuration
-CONTRACT_ADDRESS = sys.argv[1] if len(sys.argv) > 1 else "0x6a8227cEF7eC11666936EBd182Fbe8154602e773"
+CONTRACT_ADDRESS = to_checksum_address(sys.argv[1] if len(sys.argv) > 1 else "0x6a8227cEF7eC11666936EBd182Fbe8154602e773")
 TOKEN_NAME = sys.argv[2] if len(sys.argv) > 2 else "ZetaChain Test Token"
 TOKEN_SYMBOL = sys.argv[3] if len(sys.argv) > 3 else "ZTT"
 # Always use ZetaChain for this script 
 CHAIN_ID = "7001"
 
+# Parse the token ABI once at import and index it
+TOKEN_ABI, _ = _load_artifact(ZC_TOKEN_PATH)
+ABI_INDEX = index_abi(TOKEN_ABI or [])
+PARAM_TYPES = {
+    name: [inp['type'] for inp in item.get('inputs', [])]
+    for (name, item_type), item in ABI_INDEX.items()
+    if item_type == 'function'
+}
+INITIALIZE_SIGNATURE = "initialize(address,string,string,address,uint256,address)"
+SELECTOR_INITIALIZE = bytes.fromhex("650b4f8b")
+if __debug__:
+    assert Web3.keccak(text=INITIALIZE_SIGNATURE)[:4] == SELECTOR_INITIALIZE
+
 async def init_token():
     """Initialize a ZetaChain token using direct ABI encoding"""
     logger.info(f"Initializing token at {CONTRACT_ADDRESS} on ZetaChain...")
@@ -42,8 +58,8 @@ async def init_token():
         logger.error("Failed to get web3 or account")
         return False
     
-    # Load token ABI for contract interaction
-    token_abi, _ = _load_artifact(ZC_TOKEN_PATH)
+    # Token ABI is loaded once at import
+    token_abi = TOKEN_ABI
     if not token_abi:
         logger.error(f"Failed to load token ABI from {ZC_TOKEN_PATH}")
         return False
@@ -65,29 +81,22 @@ async def init_token():
         uniswap_router_address = "0x2ca7d64A7EFE2D62A725E2B35Cf7230D6677FfEe"  # Default for testnet
         logger.warning(f"Using default router address: {uniswap_router_address}")
     
-    # Convert all addresses to checksum format
-    owner_address = to_checksum_address(account.address)
+    # Convert the configured addresses to checksum format; the account address already is
+    owner_address = account.address
     gateway_address = to_checksum_address(gateway_address)
     uniswap_router_address = to_checksum_address(uniswap_router_address)
-    contract_address = to_checksum_address(CONTRACT_ADDRESS)
+    contract_address = CONTRACT_ADDRESS
     
     logger.info(f"Owner address: {owner_address}")
     logger.info(f"Gateway address: {gateway_address}")
     logger.info(f"Router address: {uniswap_router_address}")
     
-    # Find initialize function in ABI to get function selector
-    initialize_abi = None
-    for item in token_abi:
-        if isinstance(item, dict) and item.get('type') == 'function' and item.get('name') == 'initialize':
-            initialize_abi = item
-            break
-    
-    if not initialize_abi:
+    # Look up the initialize function in the pre-built ABI index
+    if ('initialize', 'function') not in ABI_INDEX:
         logger.error("Initialize function not found in ABI")
         return False
     
-    # Extract parameter types from ABI
-    param_types = [inp['type'] for inp in initialize_abi.get('inputs', [])]
+    param_types = PARAM_TYPES['initialize']
     logger.info(f"Initialize function parameter types: {param_types}")
     
     # Prepare parameters
@@ -105,77 +114,50 @@ async def init_token():
         logger.info(f"Parameter {i}: {p} ({t})")
     
     # Manual ABI encoding to work around web3.py checksum validation
-    
-    # 1. Create the function selector
-    selector = Web3.keccak(text="initialize(address,string,string,address,uint256,address)")[0:4].hex()
-    logger.info(f"Function selector: 0x{selector}")
-    
-    # 2. Encode parameters
-    try:
-        encoded_params = eth_abi.encode(
-            param_types,
-            params
-        ).hex()
-        logger.info(f"Encoded parameters: 0x{encoded_params[:64]}...")
-    except Exception as e:
-        logger.error(f"Error encoding parameters: {e}")
+    logger.info(f"Function selector: {web3.to_hex(SELECTOR_INITIALIZE)}")
+    
+    result = await send_raw_call(
+        web3=web3,
+        account=account,
+        to=contract_address,
+        selector=SELECTOR_INITIALIZE,
+        param_types=param_types,
+        params=params,
+        gas=8000000
+    )
+    if result.get("transaction_hash"):
+        logger.info(f"Transaction sent with hash: {result['transaction_hash']}")
+    
+    if not result.get("success"):
+        logger.error(f"Initialization failed! {result.get('message')}")
         return False
     
-    # 3. Combine selector and encoded params
-    data = f"0x{selector}{encoded_params}"
-    logger.info(f"Transaction data: {data[:64]}...")
-    
-    # Prepare transaction
-    tx = {
-        'from': account.address,
-        'to': contract_address,
-        'data': data,
-        'gas': 8000000,
-        'gasPrice': web3.eth.gas_price,
-        'nonce': web3.eth.get_transaction_count(account.address)
-    }
-    
-    # Sign and send transaction
+    logger.info(f"Initialization successful! Gas used: {result['receipt'].get('gasUsed')}")
+    
+    # Verify the initialization worked
+    contract = web3.eth.contract(address=contract_address, abi=token_abi)
     try:
-        signed_tx = account.sign_transaction(tx)
-        tx_hash = web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-        logger.info(f"Transaction sent with hash: {web3.to_hex(tx_hash)}")
+        # Check name, symbol and owner in a single round-trip
+        state = multicall_view_functions(web3, contract, ["name", "symbol", "owner"])
+        name = multicall_result(state, "name")
+        symbol = multicall_result(state, "symbol")
+        owner = multicall_result(state, "owner")
         
-        # Wait for receipt
-        receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        logger.info(f"Token name: {name}")
+        logger.info(f"Token symbol: {symbol}")
+        logger.info(f"Token owner: {owner}")
         
-        if receipt.status == 1:
-            logger.info(f"Initialization successful! Gas used: {receipt.gasUsed}")
-            
-            # Verify the initialization worked
-            contract = web3.eth.contract(address=contract_address, abi=token_abi)
-            try:
-                # Check name and symbol
-                name = contract.functions.name().call()
-                symbol = contract.functions.symbol().call()
-                owner = contract.functions.owner().call()
-                
-                logger.info(f"Token name: {name}")
-                logger.info(f"Token symbol: {symbol}")
-                logger.info(f"Token owner: {owner}")
-                
-                if name == TOKEN_NAME and symbol == TOKEN_SYMBOL and owner.lower() == account.address.lower():
-                    logger.info("Initialization verified successfully!")
-                    return True
-                else:
-                    logger.warning("Initialization may have failed - token data mismatch")
-                    logger.warning(f"Expected: {TOKEN_NAME}/{TOKEN_SYMBOL}/{account.address}")
-                    logger.warning(f"Got: {name}/{symbol}/{owner}")
-            except Exception as e:
-                logger.error(f"Error verifying initialization: {e}")
-                
+        if name == TOKEN_NAME and symbol == TOKEN_SYMBOL and owner.lower() == owner_address.lower():
+            logger.info("Initialization verified successfully!")
             return True
         else:
-            logger.error(f"Initialization failed! Transaction reverted.")
-            return False
+            logger.warning("Initialization may have failed - token data mismatch")
+            logger.warning(f"Expected: {TOKEN_NAME}/{TOKEN_SYMBOL}/{account.address}")
+            logger.warning(f"Got: {name}/{symbol}/{owner}")
     except Exception as e:
-        logger.error(f"Error sending transaction: {e}")
-        return False
+        logger.error(f"Error verifying initialization: {e}")
+        
+    return True
 
 async def main():
     """Main function to run the initialization"""
@@ -30,7 +30,8 @@ config.set_main_option(
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-if config.config_file_name is not None:
+# Skipped when run from the app at startup so the service's logging is kept.
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # Add your model's MetaData object here
@@ -86,6 +87,9 @@ def run_migrations_online() -> None:
         )
 
         with context.begin_transaction():
+            if connection.dialect.name == "postgresql":
+                # Fail fast instead of queueing behind long-running transactions
+                connection.exec_driver_sql("SET lock_timeout = '5s'")
             context.run_migrations()
 
 
@@ -6,8 +6,6 @@ Create Date: 2025-04-04 15:59:35.503443
 
 """
 from alembic import op
-import sqlalchemy as sa
-from sqlalchemy import inspect
 
 
 # revision identifiers, used by Alembic.
@@ -19,12 +17,11 @@ depends_on = None
 
 def upgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
-    conn = op.get_bind()
-    inspector = inspect(conn)
-    columns = [col['name'] for col in inspector.get_columns('token_deployments')]
-    
-    if 'zc_implementation_address' not in columns:
-        op.add_column('token_deployments', sa.Column('zc_implementation_address', sa.String(), nullable=True))
+    # Let Postgres guard against an existing column instead of reflecting the table first
+    op.execute(
+        "ALTER TABLE token_deployments "
+        "ADD COLUMN IF NOT EXISTS zc_implementation_address VARCHAR"
+    )
     # ### end Alembic commands ###
 
 
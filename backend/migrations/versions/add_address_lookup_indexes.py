@@ -0,0 +1,72 @@
+"""add_address_lookup_indexes
+
+Revision ID: 4c5d6e7f8a9b
+Revises: 3b4c5d6e7f8a
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = '4c5d6e7f8a9b'
+down_revision = '3b4c5d6e7f8a'
+branch_labels = None
+depends_on = None
+
+
+# Case-insensitive address lookups (token by ZetaChain contract, tokens by deployer)
+LOOKUP_INDEXES = {
+    'ix_token_deployments_zc_contract_address_lower': 'lower(zc_contract_address)',
+    'ix_token_deployments_deployer_address_lower': 'lower(deployer_address)',
+}
+
+
+def _drop_if_invalid(conn, name: str) -> None:
+    """Drop an index left INVALID by an interrupted CONCURRENTLY build, so IF NOT EXISTS rebuilds it."""
+    invalid = conn.execute(
+        sa.text(
+            "SELECT 1 FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name},
+    ).scalar()
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name == 'postgresql':
+        # Build without blocking writes to token_deployments; CONCURRENTLY can't run in a transaction
+        with op.get_context().autocommit_block():
+            op.execute("SET lock_timeout = '3s'")
+            for name, expression in LOOKUP_INDEXES.items():
+                _drop_if_invalid(conn, name)
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                    f"ON token_deployments ({expression})"
+                )
+            # SET persists on the session-level connection in autocommit mode
+            op.execute("RESET lock_timeout")
+        return
+
+    inspector = inspect(conn)
+    indexes = [index['name'] for index in inspector.get_indexes('token_deployments')]
+
+    for name, expression in LOOKUP_INDEXES.items():
+        if name not in indexes:
+            op.create_index(name, 'token_deployments', [sa.text(expression)], unique=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name in LOOKUP_INDEXES:
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        return
+
+    for name in LOOKUP_INDEXES:
+        op.drop_index(name, table_name='token_deployments')
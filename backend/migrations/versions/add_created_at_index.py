@@ -0,0 +1,67 @@
+"""add_created_at_index
+
+Revision ID: 3b4c5d6e7f8a
+Revises: 2a3b4c5d6e7f
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = '3b4c5d6e7f8a'
+down_revision = '2a3b4c5d6e7f'
+branch_labels = None
+depends_on = None
+
+
+def _drop_if_invalid(conn, name: str) -> None:
+    """Drop an index left INVALID by an interrupted CONCURRENTLY build, so IF NOT EXISTS rebuilds it."""
+    invalid = conn.execute(
+        sa.text(
+            "SELECT 1 FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name},
+    ).scalar()
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def upgrade() -> None:
+    # Supports "most recent deployments first" scans (e.g. delete_old_records.py)
+    conn = op.get_bind()
+    if conn.dialect.name == 'postgresql':
+        # Build without blocking writes to token_deployments; CONCURRENTLY can't run in a transaction
+        with op.get_context().autocommit_block():
+            op.execute("SET lock_timeout = '3s'")
+            _drop_if_invalid(conn, 'ix_token_deployments_created_at_id')
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_token_deployments_created_at_id "
+                "ON token_deployments (created_at DESC, id DESC)"
+            )
+            # SET persists on the session-level connection in autocommit mode
+            op.execute("RESET lock_timeout")
+        return
+
+    inspector = inspect(conn)
+    indexes = [index['name'] for index in inspector.get_indexes('token_deployments')]
+
+    if 'ix_token_deployments_created_at_id' not in indexes:
+        op.create_index(
+            'ix_token_deployments_created_at_id',
+            'token_deployments',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_token_deployments_created_at_id")
+        return
+
+    op.drop_index('ix_token_deployments_created_at_id', table_name='token_deployments')
@@ -21,38 +21,30 @@ def upgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
     # Check if SequelizeMeta table exists before dropping it
     conn = op.get_bind()
-    inspector = inspect(conn)
-    if 'SequelizeMeta' in inspector.get_table_names():
+    table_names = inspect(conn).get_table_names()
+    if 'SequelizeMeta' in table_names:
         op.drop_table('SequelizeMeta')
     
     # Check if token_deployments table exists before altering
-    if 'token_deployments' in inspector.get_table_names():
-        op.add_column('token_deployments', sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False))
-        op.add_column('token_deployments', sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False))
-        op.alter_column('token_deployments', 'token_name',
-                   existing_type=sa.VARCHAR(length=255),
-                   nullable=False)
-        op.alter_column('token_deployments', 'token_symbol',
-                   existing_type=sa.VARCHAR(length=255),
-                   nullable=False)
-        op.alter_column('token_deployments', 'decimals',
-                   existing_type=sa.INTEGER(),
-                   nullable=False)
-        op.alter_column('token_deployments', 'total_supply',
-                   existing_type=sa.VARCHAR(length=255),
-                   nullable=False)
-        op.alter_column('token_deployments', 'deployer_address',
-                   existing_type=sa.VARCHAR(length=255),
-                   nullable=False)
-        op.alter_column('token_deployments', 'connected_chains_json',
-                   existing_type=postgresql.JSONB(astext_type=sa.Text()),
-                   nullable=False)
-        op.alter_column('token_deployments', 'deployment_status',
-                   existing_type=sa.VARCHAR(length=255),
-                   nullable=False)
+    if 'token_deployments' in table_names:
+        # All column changes in one ALTER TABLE so the table is locked and scanned once
+        op.execute(
+            """
+            ALTER TABLE token_deployments
+                ADD COLUMN created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+                ADD COLUMN updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+                ALTER COLUMN token_name SET NOT NULL,
+                ALTER COLUMN token_symbol SET NOT NULL,
+                ALTER COLUMN decimals SET NOT NULL,
+                ALTER COLUMN total_supply SET NOT NULL,
+                ALTER COLUMN deployer_address SET NOT NULL,
+                ALTER COLUMN connected_chains_json SET NOT NULL,
+                ALTER COLUMN deployment_status SET NOT NULL,
+                DROP COLUMN "createdAt",
+                DROP COLUMN "updatedAt"
+            """
+        )
         op.create_index(op.f('ix_token_deployments_id'), 'token_deployments', ['id'], unique=False)
-        op.drop_column('token_deployments', 'createdAt')
-        op.drop_column('token_deployments', 'updatedAt')
     else:
         # Create token_deployments table if it doesn't exist
         op.create_table('token_deployments',
@@ -0,0 +1,77 @@
+"""drop_redundant_id_indexes
+
+Revision ID: 5d6e7f8a9b0c
+Revises: 4c5d6e7f8a9b
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = '5d6e7f8a9b0c'
+down_revision = '4c5d6e7f8a9b'
+branch_labels = None
+depends_on = None
+
+
+# Plain btree indexes on id that duplicate each table's primary key index
+REDUNDANT_ID_INDEXES = {
+    'ix_token_deployments_id': 'token_deployments',
+    'ix_nft_deployments_id': 'nft_deployments',
+}
+
+
+def _drop_if_invalid(conn, name: str) -> None:
+    """Drop an index left INVALID by an interrupted CONCURRENTLY build, so IF NOT EXISTS rebuilds it."""
+    invalid = conn.execute(
+        sa.text(
+            "SELECT 1 FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name},
+    ).scalar()
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name == 'postgresql':
+        # Drop without blocking reads/writes; CONCURRENTLY can't run in a transaction
+        with op.get_context().autocommit_block():
+            op.execute("SET lock_timeout = '3s'")
+            for name in REDUNDANT_ID_INDEXES:
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+            # SET persists on the session-level connection in autocommit mode
+            op.execute("RESET lock_timeout")
+        return
+
+    inspector = inspect(conn)
+    table_names = inspector.get_table_names()
+
+    for name, table in REDUNDANT_ID_INDEXES.items():
+        if table not in table_names:
+            continue
+        indexes = [index['name'] for index in inspector.get_indexes(table)]
+        if name in indexes:
+            op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    table_names = inspect(conn).get_table_names()
+
+    if conn.dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, table in REDUNDANT_ID_INDEXES.items():
+                if table in table_names:
+                    _drop_if_invalid(conn, name)
+                    op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} (id)")
+        return
+
+    for name, table in REDUNDANT_ID_INDEXES.items():
+        if table in table_names:
+            op.create_index(name, table, ['id'], unique=False)
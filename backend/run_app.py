@@ -2,23 +2,30 @@
 Simple script to run the FastAPI application.
 Make sure to run 'pip install uvicorn' first in your virtual environment.
 """
-import os
-import sys
-
-# Add current directory to sys.path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import argparse
 
 # Run the application
 if __name__ == "__main__":
     try:
         import uvicorn
         from app.app import app, Config
+
+        parser = argparse.ArgumentParser(description="Run the Universal Token Contract Deployment Service")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=Config.WORKERS,
+            help="Number of uvicorn worker processes (defaults to WORKERS env var or 1)",
+        )
+        args = parser.parse_args()
         
         print("Starting the Universal Token Contract Deployment Service...")
         uvicorn.run(
-            app, 
+            # Multiple workers need an import string so each process can load the app
+            "app.app:app" if args.workers > 1 else app,
             host=Config.HOST, 
             port=Config.PORT,
+            workers=args.workers,
             log_level="info"
         )
     except ImportError as e:
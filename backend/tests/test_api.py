@@ -46,16 +46,16 @@ async def test_api_endpoints():
     """Test sequence of API calls to validate the API functionality."""
     print("\n=== Testing Universal Token Launcher API ===\n")
     
-    print("1. Testing API connection...")
-    async with httpx.AsyncClient() as client:
+    # One client for the whole sequence so requests reuse the keep-alive connection
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        print("1. Testing API connection...")
         # Test root endpoint
-        response = await client.get(f"{BASE_URL}/")
+        response = await client.get("/")
         assert response.status_code == 200, "API root endpoint not accessible"
         print(f"   ✅ API is accessible: {response.text}")
     
-    print("\n2. Getting available chains...")
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BASE_URL}/api/chains")
+        print("\n2. Getting available chains...")
+        response = await client.get("/api/chains")
         assert response.status_code == 200, "API chains endpoint not accessible"
         
         chains = response.json()
@@ -64,19 +64,21 @@ async def test_api_endpoints():
         
         print(f"   ✅ Received chain list. {len(chains['chains'])} chains available")
             
-        # Handle different response formats
-        for chain in chains['chains']:
-            # Try to extract chain ID in both potential formats
-            chain_id = chain.get('chain_id') or chain.get('id')
-            name = chain.get('name', 'Unknown')
-            currency = chain.get('currency_symbol') or chain.get('currency', 'Unknown')
-                
-            print(f"      - {chain_id}: {name} ({currency})")
-                
-            # Set ZetaChain as the target chain if found
-            if str(chain_id) == "7001":
-                TEST_TOKEN['selected_chains'] = [str(chain_id)]
-                print(f"      - Selected {name} for test deployment")
+        # Handle different response formats; chain IDs may come as 'chain_id' or 'id'
+        print("\n".join(
+            f"      - {chain.get('chain_id') or chain.get('id')}: {chain.get('name', 'Unknown')} "
+            f"({chain.get('currency_symbol') or chain.get('currency', 'Unknown')})"
+            for chain in chains['chains']
+        ))
+        
+        # Set ZetaChain as the target chain if found, outside the display loop
+        selected = next(
+            (chain for chain in chains['chains'] if str(chain.get('chain_id') or chain.get('id')) == "7001"),
+            None
+        )
+        if selected:
+            TEST_TOKEN['selected_chains'] = [str(selected.get('chain_id') or selected.get('id'))]
+            print(f"      - Selected {selected.get('name', 'Unknown')} for test deployment")
     
     # For automated testing, skip token deployment
     test_deployment = 'n'  # Skip interactive input
@@ -5,14 +5,43 @@ Test the BlockScout API verification process directly to diagnose issues
 with contract verification on ZetaChain's explorer.
 """
 
+import aiofiles
+import asyncio
 import os
-import requests
+import httpx
 import json
+import orjson
 import pytest
-from app.utils.web3_helper import SMART_CONTRACTS_DIR, extract_compiler_version
+from urllib.parse import urlencode
+from app.utils.web3_helper import load_contract_source
 from app.utils.chain_config import get_chain_config
 
 
+# Contract sources live in smart-contracts/ at the repository root
+SMART_CONTRACTS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "smart-contracts"
+)
+CONTRACTS_DIR = os.path.join(SMART_CONTRACTS_DIR, "contracts")
+
+
+def _scan_contract_sources(contracts_dir):
+    """Map contract name to its .sol source path with one directory scan; None if the directory is missing."""
+    try:
+        with os.scandir(contracts_dir) as entries:
+            return {
+                entry.name[:-len(".sol")]: entry.path
+                for entry in entries
+                if entry.name.endswith(".sol") and entry.is_file()
+            }
+    except FileNotFoundError:
+        return None
+
+
+# Contract sources available for verification, scanned once at import
+CONTRACT_SOURCES = _scan_contract_sources(CONTRACTS_DIR)
+
+
 @pytest.fixture
 def contract_address():
     """Fixture providing a known contract address on ZetaChain testnet for verification testing."""
@@ -26,12 +55,113 @@ def chain_id():
     return "7001"
 
 
-def test_blockscout_api_verification(
+@pytest.fixture(scope="session")
+def artifact_sink():
+    """Fixture collecting request/response JSON artifacts in memory, flushed once per session."""
+    sink = {}
+    yield sink
+    asyncio.run(flush_artifacts(sink))
+
+
+# BlockScout's verify endpoint is slow to answer; don't give up at the default timeout
+VERIFY_TIMEOUT = httpx.Timeout(120.0)
+
+# A handful of explorer hosts at most; keep their connections alive between requests
+VERIFY_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=4)
+
+# Set to 1 to write the buffered verification requests/responses to disk
+DUMP_ARTIFACTS_ENV = "DUMP_VERIFICATION_ARTIFACTS"
+
+
+def _new_client():
+    """Keep-alive client for the explorer APIs; failed connection attempts are retried twice."""
+    return httpx.AsyncClient(
+        timeout=VERIFY_TIMEOUT,
+        limits=VERIFY_LIMITS,
+        transport=httpx.AsyncHTTPTransport(retries=2, limits=VERIFY_LIMITS)
+    )
+
+
+async def _write_artifact(filename, data):
+    async with aiofiles.open(filename, 'wb') as f:
+        await f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    print(f"✅ Saved: {filename}")
+
+
+async def flush_artifacts(sink):
+    """Write buffered artifacts to disk, concurrently, when DUMP_VERIFICATION_ARTIFACTS=1."""
+    if os.environ.get(DUMP_ARTIFACTS_ENV) != "1":
+        return
+    await asyncio.gather(*[_write_artifact(filename, data) for filename, data in sink.items()])
+
+
+@pytest.mark.asyncio
+async def test_blockscout_api_verification(
     contract_address, 
     chain_id, 
+    artifact_sink,
     contract_name="ZetaChainUniversalToken"
 ):
     """Test verification using BlockScout API directly."""
+    async with _new_client() as client:
+        await _verify_one(client, artifact_sink, contract_address, chain_id, contract_name)
+    
+    _print_smart_contracts_dir()
+
+
+async def _verify_one(client, sink, contract_address, chain_id, contract_name):
+    """Submit one contract to the BlockScout verification API."""
+    prepared = _prepare_verification(sink, contract_address, chain_id, contract_name)
+    if not prepared:
+        return
+    explorer_url, verification_data, verification_data_v2 = prepared
+    
+    verification_url = f"{explorer_url}/api"
+    verification_url_v2 = f"{explorer_url}/api/v2/smart-contracts/verify/standard-json"
+    
+    # Encode each request body once, up front; both embed the full contract source
+    body_v1 = urlencode(verification_data).encode()
+    body_v2 = orjson.dumps(verification_data_v2)
+    
+    async def post_v1():
+        response = await client.post(
+            verification_url, 
+            content=body_v1,
+            headers={"Content-Type": "application/x-www-form-urlencoded"}
+        )
+        return "v1", response
+    
+    async def post_v2():
+        response = await client.post(
+            verification_url_v2, 
+            content=body_v2,
+            headers={"Content-Type": "application/json"}
+        )
+        return "v2", response
+    
+    # Race both endpoints: the first accepted submission wins and the other
+    # request is cancelled; a failure waits on the remaining endpoint instead
+    print("\n=== Testing Primary and Alternative BlockScout API Endpoints ===")
+    print(f"Sending verification request to: {verification_url}")
+    print(f"Sending verification request to: {verification_url_v2}")
+    pending = {asyncio.create_task(post_v1()), asyncio.create_task(post_v2())}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if any(post_process(task, contract_name, sink) for task in done):
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _prepare_verification(sink, contract_address, chain_id, contract_name):
+    """
+    Build the v1 and v2 verification payloads for one contract.
+    
+    Returns:
+        Tuple of (explorer_url, verification_data, verification_data_v2), or None
+    """
     print(f"\n=== Testing BlockScout API Verification for {contract_name} ===")
     
     # Get chain configuration
@@ -50,38 +180,24 @@ def test_blockscout_api_verification(
     explorer_url = explorer_url.rstrip('/')
     
     # Check if contract source exists
-    contract_file = f"{contract_name}.sol"
-    contract_path = os.path.join(
-        SMART_CONTRACTS_DIR,
-        "contracts",
-        contract_file
-    )
-    
-    if not os.path.exists(contract_path):
-        print(f"❌ Contract source not found at {contract_path}")
-        # Check if the parent directory exists
-        parent_dir = os.path.dirname(contract_path)
-        if not os.path.exists(parent_dir):
-            print(f"❌ Parent directory not found: {parent_dir}")
+    contract_path = (CONTRACT_SOURCES or {}).get(contract_name)
+    if contract_path is None:
+        print(f"❌ Contract source not found at {os.path.join(CONTRACTS_DIR, f'{contract_name}.sol')}")
+        if CONTRACT_SOURCES is None:
+            print(f"❌ Parent directory not found: {CONTRACTS_DIR}")
         else:
-            print(f"✅ Parent directory exists: {parent_dir}")
-            # List files in the directory
-            print("Files in the directory:")
-            for file in os.listdir(parent_dir):
-                print(f"  - {file}")
+            print(f"✅ Parent directory exists: {CONTRACTS_DIR}")
+            # List the contract sources found there
+            print("Contract sources in the directory:")
+            for name in CONTRACT_SOURCES:
+                print(f"  - {name}.sol")
         return
     
-    print(f"✅ Contract source found at {contract_path}")
-    
-    # Read contract source
-    with open(contract_path, 'r') as f:
-        contract_source = f.read()
-        compiler_version = extract_compiler_version(contract_source)
-        print(f"✅ Detected compiler version: {compiler_version}")
+    # Read contract source (cached across calls for the same file)
+    contract_source, compiler_version = load_contract_source(contract_path)
     
-    # Try verification with primary API endpoint
-    print("\n=== Testing Primary BlockScout API Endpoint ===")
-    verification_url = f"{explorer_url}/api"
+    print(f"✅ Contract source found at {contract_path}")
+    print(f"✅ Detected compiler version: {compiler_version}")
     
     # Prepare verification data according to BlockScout API
     verification_data = {
@@ -98,17 +214,24 @@ def test_blockscout_api_verification(
         "codeformat": "solidity-single-file"  # Required format for BlockScout
     }
     
-    # Save full verification data to file (including source code)
-    full_data_filename = f"{contract_name}_full_verification_data.json"
-    with open(full_data_filename, 'w') as f:
-        json.dump(verification_data, f, indent=2)
-    print(f"✅ Full verification data saved to: {full_data_filename}")
-    
-    headers = {
-        "Content-Type": "application/x-www-form-urlencoded"
+    # Prepare verification data for v2 API (different format)
+    verification_data_v2 = {
+        "address": contract_address,
+        "compiler_version": compiler_version,
+        "evm_version": "paris",
+        "optimization": True,
+        "optimization_runs": 200,
+        "contract_libraries": {},
+        "source_files": {
+            f"{contract_name}.sol": contract_source
+        },
+        "contract_name": contract_name
     }
     
-    print(f"Sending verification request to: {verification_url}")
+    # Buffer full verification data (including source code)
+    sink[f"{contract_name}_full_verification_data.json"] = verification_data
+    sink[f"{contract_name}_full_verification_data_v2.json"] = verification_data_v2
+    
     print("Request data:")
     data_display = {
         k: (v if k != 'sourceCode' else '...source truncated...') 
@@ -116,139 +239,89 @@ def test_blockscout_api_verification(
     }
     print(json.dumps(data_display, indent=2))
     
+    return explorer_url, verification_data, verification_data_v2
+
+
+def post_process(task, contract_name, sink):
+    """
+    Print and buffer the outcome of one verification request.
+    
+    Returns:
+        True if the endpoint accepted the submission
+    """
     try:
-        response = requests.post(
-            verification_url, 
-            data=verification_data,
-            headers=headers
-        )
-        
-        print(f"\nResponse status code: {response.status_code}")
-        
-        if response.status_code in (200, 201, 202):
-            try:
-                response_data = response.json()
-                print("Response data:")
-                print(json.dumps(response_data, indent=2))
-                
-                # Save response to file
-                response_filename = f"{contract_name}_verification_response.json"
-                with open(response_filename, 'w') as f:
-                    json.dump(response_data, f, indent=2)
-                print(f"✅ Response data saved to: {response_filename}")
-                
-                if "result" in response_data and "status" in response_data:
-                    if response_data["status"] == "1":
-                        print("✅ Verification request submitted successfully")
-                    else:
-                        error_msg = response_data.get('result', 'Unknown error')
-                        print(f"❌ Verification request failed: {error_msg}")
-                else:
-                    print("✅ Verification request submitted (no status information)")
-            except Exception as e:
-                print(f"❌ Error parsing JSON response: {str(e)}")
-                print(f"Response text: {response.text}")
-        else:
-            print(f"❌ Request failed with status {response.status_code}")
-            print(f"Response text: {response.text}")
-            
-            # Try alternative API endpoint
-            print("\n=== Testing Alternative BlockScout API Endpoint ===")
-            verification_url_v2 = (
-                f"{explorer_url}/api/v2/smart-contracts/verify/standard-json"
-            )
-            
-            # Prepare verification data for v2 API (different format)
-            verification_data_v2 = {
-                "address": contract_address,
-                "compiler_version": compiler_version,
-                "evm_version": "paris",
-                "optimization": True,
-                "optimization_runs": 200,
-                "contract_libraries": {},
-                "source_files": {
-                    f"{contract_name}.sol": contract_source
-                },
-                "contract_name": contract_name
-            }
-            
-            # Save full v2 verification data to file
-            full_data_v2_filename = f"{contract_name}_full_verification_data_v2.json"
-            with open(full_data_v2_filename, 'w') as f:
-                json.dump(verification_data_v2, f, indent=2)
-            print(f"✅ Full v2 verification data saved to: {full_data_v2_filename}")
-            
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
-            print("Sending verification request to alternative endpoint:")
-            print(verification_url_v2)
-            
-            try:
-                response = requests.post(
-                    verification_url_v2, 
-                    json=verification_data_v2,
-                    headers=headers
-                )
-                
-                print(f"\nResponse status code: {response.status_code}")
-                
-                if response.status_code in (200, 201, 202):
-                    try:
-                        response_data = response.json()
-                        print("Response data:")
-                        print(json.dumps(response_data, indent=2))
-                        
-                        # Save v2 response to file
-                        response_v2_filename = f"{contract_name}_verification_response_v2.json"
-                        with open(response_v2_filename, 'w') as f:
-                            json.dump(response_data, f, indent=2)
-                        print(f"✅ v2 Response data saved to: {response_v2_filename}")
-                        
-                        print("✅ Verification request submitted via alternative API")
-                    except Exception as e:
-                        print(f"❌ Error parsing JSON response: {str(e)}")
-                        print(f"Response text: {response.text}")
-                else:
-                    failed_status = response.status_code
-                    print(f"❌ Alternative API request failed with status {failed_status}")
-                    print(f"Response text: {response.text}")
-            except Exception as e:
-                print(f"❌ Error with alternative API request: {str(e)}")
+        endpoint, response = task.result()
     except Exception as e:
         print(f"❌ Error sending verification request: {str(e)}")
+        return False
+    
+    print(f"\n[{endpoint}] Response status code: {response.status_code}")
+    if response.status_code not in (200, 201, 202):
+        print(f"❌ [{endpoint}] Request failed with status {response.status_code}")
+        print(f"Response text: {response.text}")
+        return False
+    
+    try:
+        response_data = response.json()
+    except Exception as e:
+        print(f"❌ Error parsing JSON response: {str(e)}")
+        print(f"Response text: {response.text}")
+        return False
+    
+    print("Response data:")
+    print(json.dumps(response_data, indent=2))
     
-    # Print directory structure for debugging
+    # Buffer response for the end-of-run flush
+    suffix = "" if endpoint == "v1" else "_v2"
+    sink[f"{contract_name}_verification_response{suffix}.json"] = response_data
+    
+    if endpoint == "v2":
+        print("✅ Verification request submitted via alternative API")
+        return True
+    
+    if "result" in response_data and "status" in response_data:
+        if response_data["status"] == "1":
+            print("✅ Verification request submitted successfully")
+            return True
+        error_msg = response_data.get('result', 'Unknown error')
+        print(f"❌ Verification request failed: {error_msg}")
+        return False
+    
+    print("✅ Verification request submitted (no status information)")
+    return True
+
+
+def _print_smart_contracts_dir():
+    """Print the smart contracts directory structure for debugging."""
     print("\n=== Smart Contracts Directory Structure ===")
     print(f"SMART_CONTRACTS_DIR: {SMART_CONTRACTS_DIR}")
     
     try:
-        # List the main directory
-        if os.path.exists(SMART_CONTRACTS_DIR):
-            print(f"✅ Directory exists: {SMART_CONTRACTS_DIR}")
-            print("Contents:")
-            for item in os.listdir(SMART_CONTRACTS_DIR):
-                item_path = os.path.join(SMART_CONTRACTS_DIR, item)
-                if os.path.isdir(item_path):
-                    print(f"  📁 {item}/")
-                else:
-                    print(f"  📄 {item}")
-            
-            # Check if contracts directory exists
-            contracts_dir = os.path.join(SMART_CONTRACTS_DIR, "contracts")
-            if os.path.exists(contracts_dir):
-                print("\n✅ Contracts directory exists:")
-                print(contracts_dir)
-                print("Contents:")
-                for item in os.listdir(contracts_dir):
-                    print(f"  📄 {item}")
-            else:
-                print("\n❌ Contracts directory not found:")
-                print(contracts_dir)
-        else:
+        # List the main directory; DirEntry carries the file type from readdir, so no stat per entry
+        try:
+            with os.scandir(SMART_CONTRACTS_DIR) as entries:
+                items = [(entry.name, entry.is_dir(follow_symlinks=False)) for entry in entries]
+        except FileNotFoundError:
             print("\n❌ SMART_CONTRACTS_DIR not found:")
             print(SMART_CONTRACTS_DIR)
+            return
+        
+        print(f"✅ Directory exists: {SMART_CONTRACTS_DIR}")
+        print("Contents:")
+        for name, is_dir in items:
+            print(f"  📁 {name}/" if is_dir else f"  📄 {name}")
+        
+        # Contract sources were scanned once at import
+        if CONTRACT_SOURCES is None:
+            print("\n❌ Contracts directory not found:")
+            print(CONTRACTS_DIR)
+            return
+        
+        print("\n✅ Contracts directory exists:")
+        print(CONTRACTS_DIR)
+        print("Contract sources:")
+        for name in CONTRACT_SOURCES:
+            print(f"  📄 {name}.sol")
     except Exception as e:
         print(f"❌ Exception listing directories: {str(e)}")
 
@@ -266,6 +339,10 @@ if __name__ == "__main__":
     print(f"- Chain ID: {CHAIN_ID}")
     print(f"- Contract name: {CONTRACT_NAME}")
     
-    test_blockscout_api_verification(CONTRACT_ADDRESS, CHAIN_ID, CONTRACT_NAME)
+    # Keep the request/response files when run by hand
+    os.environ.setdefault(DUMP_ARTIFACTS_ENV, "1")
+    sink = {}
+    asyncio.run(test_blockscout_api_verification(CONTRACT_ADDRESS, CHAIN_ID, sink, CONTRACT_NAME))
+    asyncio.run(flush_artifacts(sink))
     
     print("\nDone! Check the output above for verification results.") 
\ No newline at end of file
@@ -8,13 +8,29 @@ import os
 import asyncio
 import sys
 import re
-from web3 import Web3
 
 # Add the parent directory to PYTHONPATH
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 # Now import from app
-from app.utils.web3_helper import load_contract_data, ZC_UNIVERSAL_TOKEN_ABI, UNIVERSAL_TOKEN_ABI
+from app.utils.web3_helper import (
+    load_contract_data,
+    load_contract_source,
+    index_abi,
+    ZC_UNIVERSAL_TOKEN_ABI,
+    UNIVERSAL_TOKEN_ABI
+)
+
+_ZC_ID_RE = re.compile(r"ZETACHAIN_ID\s*=\s*(\d+)", re.ASCII)
+
+
+def _scan_zetachain_id(contract_path):
+    """Return the ZETACHAIN_ID match in a contract source, or None if the file is missing."""
+    try:
+        content, _ = load_contract_source(contract_path)
+    except FileNotFoundError:
+        return None
+    return _ZC_ID_RE.search(content) or False
 
 
 async def check_contract_chain_ids():
@@ -27,30 +43,13 @@ async def check_contract_chain_ids():
     # Check ZetaChainUniversalToken
     zc_abi = ZC_UNIVERSAL_TOKEN_ABI
     try:
-        # Create a dummy Web3 instance
-        w3 = Web3()
-        
-        # Create a contract instance without an address
-        _ = w3.eth.contract(abi=zc_abi)
-        
-        # Get the ZETACHAIN_ID from the ABI
-        zc_id = None
-        for item in zc_abi:
-            if item.get('name') == 'ZETACHAIN_ID' and item.get('type') == 'function':
-                zc_id = "Found in ABI, but need contract instance to call"
+        # Look up the ZETACHAIN_ID getter in the ABI index
+        item = index_abi(zc_abi).get(('ZETACHAIN_ID', 'function'))
+        zc_id = "Found in ABI, but need contract instance to call" if item else None
+        zetachain_constant = "Function found in ABI" if item and item.get('stateMutability') == 'view' else None
         
         print(f"ZetaChainUniversalToken ZETACHAIN_ID: {zc_id}")
         print("Note: To get the actual value, we need a deployed contract instance")
-        
-        # Check if the constant is defined in the ABI (better approach)
-        zetachain_constant = None
-        for item in zc_abi:
-            if (item.get('name') == 'ZETACHAIN_ID' and 
-                item.get('type') == 'function' and 
-                item.get('stateMutability') == 'view'):
-                zetachain_constant = "Function found in ABI"
-                break
-        
         print(f"ZetaChain ZETACHAIN_ID constant: {zetachain_constant}")
         
     except Exception as e:
@@ -59,27 +58,13 @@ async def check_contract_chain_ids():
     # Check EVMUniversalToken
     evm_abi = UNIVERSAL_TOKEN_ABI
     try:
-        # Create a contract instance without an address
-        _ = w3.eth.contract(abi=evm_abi)
-        
-        # Get the ZETACHAIN_ID from the ABI
-        evm_id = None
-        for item in evm_abi:
-            if item.get('name') == 'ZETACHAIN_ID' and item.get('type') == 'function':
-                evm_id = "Found in ABI, but need contract instance to call"
+        # Look up the ZETACHAIN_ID getter in the ABI index
+        item = index_abi(evm_abi).get(('ZETACHAIN_ID', 'function'))
+        evm_id = "Found in ABI, but need contract instance to call" if item else None
+        evm_constant = "Function found in ABI" if item and item.get('stateMutability') == 'view' else None
         
         print(f"EVMUniversalToken ZETACHAIN_ID: {evm_id}")
         print("Note: To get the actual value, we need a deployed contract instance")
-        
-        # Check if the constant is defined in the ABI
-        evm_constant = None
-        for item in evm_abi:
-            if (item.get('name') == 'ZETACHAIN_ID' and 
-                item.get('type') == 'function' and 
-                item.get('stateMutability') == 'view'):
-                evm_constant = "Function found in ABI"
-                break
-        
         print(f"EVM ZETACHAIN_ID constant: {evm_constant}")
         
     except Exception as e:
@@ -94,37 +79,23 @@ async def check_contract_chain_ids():
         "smart-contracts", "contracts"
     )
     
-    # Check ZetaChainUniversalToken.sol
-    zc_contract_path = os.path.join(contracts_dir, "ZetaChainUniversalToken.sol")
-    if os.path.exists(zc_contract_path):
-        with open(zc_contract_path, "r") as f:
-            content = f.read()
-            match = re.search(r"ZETACHAIN_ID\s*=\s*(\d+)", content)
-            if match:
-                zc_id_value = match.group(1)
-                print(f"✅ ZetaChainUniversalToken.sol ZETACHAIN_ID = {zc_id_value}")
-                if zc_id_value == "7001":
-                    print("   This is the correct value for ZetaChain testnet")
-                else:
-                    print("❌ This is NOT the correct value for ZetaChain testnet (should be 7001)")
-    else:
-        print(f"❌ ZetaChainUniversalToken.sol not found at {zc_contract_path}")
+    # Read and scan both contract sources concurrently
+    contract_files = ["ZetaChainUniversalToken.sol", "EVMUniversalToken.sol"]
+    contract_paths = [os.path.join(contracts_dir, name) for name in contract_files]
+    matches = await asyncio.gather(*[
+        asyncio.to_thread(_scan_zetachain_id, path) for path in contract_paths
+    ])
     
-    # Check EVMUniversalToken.sol
-    evm_contract_path = os.path.join(contracts_dir, "EVMUniversalToken.sol")
-    if os.path.exists(evm_contract_path):
-        with open(evm_contract_path, "r") as f:
-            content = f.read()
-            match = re.search(r"ZETACHAIN_ID\s*=\s*(\d+)", content)
-            if match:
-                evm_id_value = match.group(1)
-                print(f"✅ EVMUniversalToken.sol ZETACHAIN_ID = {evm_id_value}")
-                if evm_id_value == "7001":
-                    print("   This is the correct value for ZetaChain testnet")
-                else:
-                    print("❌ This is NOT the correct value for ZetaChain testnet (should be 7001)")
-    else:
-        print(f"❌ EVMUniversalToken.sol not found at {evm_contract_path}")
+    for contract_file, contract_path, match in zip(contract_files, contract_paths, matches):
+        if match is None:
+            print(f"❌ {contract_file} not found at {contract_path}")
+        elif match:
+            id_value = match.group(1)
+            print(f"✅ {contract_file} ZETACHAIN_ID = {id_value}")
+            if id_value == "7001":
+                print("   This is the correct value for ZetaChain testnet")
+            else:
+                print("❌ This is NOT the correct value for ZetaChain testnet (should be 7001)")
     
     print("\n=== Verification Complete ===")
     
@@ -3,40 +3,70 @@
 Test script to validate our approach for handling payable addresses
 """
 
-import json
 import os
-from web3 import Web3
+import sys
+import eth_abi
+import pytest
+from eth_utils import function_abi_to_4byte_selector, to_checksum_address
 
 # Setup paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-ZC_TOKEN_PATH = os.path.join(SCRIPT_DIR, "artifacts/ZetaChainUniversalToken.json")
+sys.path.insert(0, os.path.dirname(SCRIPT_DIR))
+ZC_TOKEN_PATH = os.path.join(os.path.dirname(SCRIPT_DIR), "artifacts", "ZetaChainUniversalToken.json")
+
+from app.utils.web3_helper import _load_artifact, index_abi
+
+# Test addresses
+GATEWAY_ADDRESS = "0x6c533f7fe93fae114d0954697069df33c9b74fd7"
+OWNER_ADDRESS = "0x04dA1034E7d84c004092671bBcEb6B1c8DCda7AE"
+
+
+def initialize_encoder(initialize_abi):
+    """
+    Build an encoder for initialize calldata from its ABI entry.
+    
+    The selector and parameter types are resolved once; each call is then a single
+    eth_abi.encode, without Web3's per-call function lookup and address validation.
+    """
+    selector = function_abi_to_4byte_selector(initialize_abi)
+    param_types = [param['type'] for param in initialize_abi.get('inputs', [])]
+    return lambda args: "0x" + (selector + eth_abi.encode(param_types, args)).hex()
+
+
+def initialize_args(gateway_address):
+    """initialize arguments with the given gateway address; everything else checksummed."""
+    return [
+        to_checksum_address(OWNER_ADDRESS),
+        "Test Token",
+        "TEST",
+        gateway_address,
+        3000000,
+        to_checksum_address(GATEWAY_ADDRESS)
+    ]
+
+
+@pytest.mark.parametrize("gateway_address", [GATEWAY_ADDRESS, GATEWAY_ADDRESS.upper().replace("0X", "0x")])
+def test_initialize_encoding_ignores_address_case(gateway_address):
+    """Address case never changes the ABI-encoded initialize calldata."""
+    contract_abi, _ = _load_artifact(ZC_TOKEN_PATH)
+    assert contract_abi, f"Could not load contract ABI from {ZC_TOKEN_PATH}"
+    encode = initialize_encoder(index_abi(contract_abi)[('initialize', 'function')])
+    
+    checksummed = encode(initialize_args(to_checksum_address(GATEWAY_ADDRESS)))
+    assert encode(initialize_args(gateway_address)) == checksummed
 
 
 def main():
     """Demo of proper encoding for payable address parameters"""
     
-    # Load the contract ABI
-    try:
-        with open(ZC_TOKEN_PATH, 'r') as f:
-            contract_data = json.load(f)
-            contract_abi = contract_data['abi']
-    except Exception as e:
-        print(f"Error loading contract ABI: {e}")
+    # Load the contract ABI (parsed with orjson and cached per file version)
+    contract_abi, _ = _load_artifact(ZC_TOKEN_PATH)
+    if not contract_abi:
+        print(f"Error loading contract ABI from {ZC_TOKEN_PATH}")
         return
     
-    # Setup Web3
-    w3 = Web3()
-    
-    # Test addresses
-    gateway_address = "0x6c533f7fe93fae114d0954697069df33c9b74fd7"
-    owner_address = "0x04dA1034E7d84c004092671bBcEb6B1c8DCda7AE"
-    
     # Find initialize function in ABI
-    initialize_abi = None
-    for item in contract_abi:
-        if isinstance(item, dict) and item.get('type') == 'function' and item.get('name') == 'initialize':
-            initialize_abi = item
-            break
+    initialize_abi = index_abi(contract_abi).get(('initialize', 'function'))
     
     if not initialize_abi:
         print("Initialize function not found in ABI")
@@ -51,40 +81,25 @@ def main():
         print(f"  {i}: {param_name} ({param_type})"
               f"{' [PAYABLE]' if is_payable else ''}")
     
-    # Create a contract instance for function encoding
-    contract = w3.eth.contract(abi=contract_abi)
+    # Resolve the selector and parameter types once for both encodings
+    encode = initialize_encoder(initialize_abi)
     
     # Test both methods of encoding
     print("\nCOMPARISON: Regular vs. Raw addressing for payable addresses\n")
     
     # Method 1: All checksummed
-    args_checksummed = [
-        w3.to_checksum_address(owner_address),
-        "Test Token",
-        "TEST",
-        w3.to_checksum_address(gateway_address),
-        3000000,
-        w3.to_checksum_address(gateway_address)
-    ]
+    args_checksummed = initialize_args(to_checksum_address(GATEWAY_ADDRESS))
     
     # Method 2: Raw address for payable parameters
-    args_raw = [
-        w3.to_checksum_address(owner_address),
-        "Test Token", 
-        "TEST",
-        gateway_address,  # raw/not checksummed for payable
-        3000000,
-        w3.to_checksum_address(gateway_address)
-    ]
+    args_raw = initialize_args(GATEWAY_ADDRESS)  # raw/not checksummed for payable
     
     # Encode both methods
     encoded1 = None
     encoded2 = None
     
     try:
-        # Method 1: All checksummed - using encode_input which doesn't require a 'to' address
-        func_obj1 = contract.functions.initialize(*args_checksummed)
-        encoded1 = func_obj1._encode_transaction_data()
+        # Method 1: All checksummed
+        encoded1 = encode(args_checksummed)
         
         print("Method 1 (All checksummed):")
         print(f"  Function data: {encoded1[:66]}...{encoded1[-64:]}")
@@ -94,8 +109,7 @@ def main():
     
     try:
         # Method 2: Raw address for payable parameter
-        func_obj2 = contract.functions.initialize(*args_raw)
-        encoded2 = func_obj2._encode_transaction_data()
+        encoded2 = encode(args_raw)
         
         print("\nMethod 2 (Raw payable address):")
         print(f"  Function data: {encoded2[:66]}...{encoded2[-64:]}")
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+
+"""Test reading contract sources and their compiler version."""
+
+from app.utils.web3_helper import load_contract_source
+
+
+def test_compiler_version_comes_from_pragma(tmp_path):
+    """The pragma's version is returned in the long form verification APIs expect."""
+    source = "// SPDX-License-Identifier: MIT\npragma solidity ^0.8.26;\n\ncontract Token {}\n"
+    contract_path = tmp_path / "Token.sol"
+    contract_path.write_text(source)
+
+    assert load_contract_source(contract_path) == (source, "v0.8.26+commit.8a97fa7a")
+
+
+def test_unknown_release_keeps_short_version(tmp_path):
+    """Versions without a known release commit are returned without one."""
+    contract_path = tmp_path / "Range.sol"
+    contract_path.write_text("pragma solidity >=0.8.30 <0.9.0;\n")
+
+    assert load_contract_source(contract_path)[1] == "v0.8.30"
@@ -1,7 +1,7 @@
 """Script to test token deployment via the API."""
 
 import asyncio
-import json
+import orjson
 import argparse
 import pytest  # Import pytest
 import os
@@ -74,9 +74,9 @@ async def test_token_deployment(testnet_only=False, max_chains=None):
     target_chain_ids = payload["target_chain_ids"]
 
     if testnet_only:
-        testnet_ids = [
+        testnet_ids = {
             chain_id for chain_id, info in enabled_chains_dict.items() if info.get("testnet")
-        ]
+        }
         target_chain_ids = [cid for cid in target_chain_ids if cid in testnet_ids]
         print(f"Filtering to testnets: {target_chain_ids}")
 
@@ -100,7 +100,7 @@ async def test_token_deployment(testnet_only=False, max_chains=None):
     ]
 
     print("\nDeployment Payload:")
-    print(json.dumps(payload, indent=2))
+    print(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
 
     deployer = DeploymentService()
     db = SessionLocal()  # Create DB session
@@ -122,7 +122,7 @@ async def test_token_deployment(testnet_only=False, max_chains=None):
             db=db  # Pass the db session
         )
         print("\nDeployment Result:")
-        print(json.dumps(result, indent=2))
+        print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
 
         assert result["final_status"] == "completed"
         assert "deploymentId" in result
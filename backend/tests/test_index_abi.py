@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+"""Test the cached (name, type) ABI index."""
+
+import pytest
+
+from app.utils import web3_helper
+
+
+def _function(name, *input_types):
+    return {"type": "function", "name": name, "inputs": [{"type": t} for t in input_types]}
+
+
+def test_overloaded_function_is_rejected():
+    """An overloaded name can't be keyed by (name, type), so indexing it fails loudly."""
+    abi = [_function("initialize", "address"), _function("initialize", "address", "uint256")]
+
+    with pytest.raises(ValueError, match="initialize"):
+        web3_helper.index_abi(abi)
+
+
+def test_cache_is_bounded(monkeypatch):
+    """Indexing more ABIs than the cache holds evicts the least recently used one."""
+    monkeypatch.setattr(web3_helper, "_abi_indexes", web3_helper.OrderedDict())
+    monkeypatch.setattr(web3_helper, "ABI_INDEX_CACHE_SIZE", 2)
+
+    first, second, third = ([_function(name)] for name in ("a", "b", "c"))
+    first_index = web3_helper.index_abi(first)
+    web3_helper.index_abi(second)
+    assert web3_helper.index_abi(first) is first_index  # refreshes first
+    web3_helper.index_abi(third)
+
+    cached_abis = [abi for abi, _ in web3_helper._abi_indexes.values()]
+    assert len(cached_abis) == 2
+    assert any(abi is first for abi in cached_abis)
+    assert not any(abi is second for abi in cached_abis)
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import aiofiles
 import asyncio
 import json
 import os
@@ -16,6 +17,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from app.utils.web3_helper import (
     get_web3, 
     get_account, 
+    batch_rpc,
     load_contract_data,
     UNIVERSAL_TOKEN_ABI,
     UNIVERSAL_TOKEN_BYTECODE,
@@ -23,6 +25,7 @@ from app.utils.web3_helper import (
     ZC_UNIVERSAL_TOKEN_BYTECODE,
     encode_initialize_data,
     deploy_implementation,
+    deploy_implementation_create2,
     deploy_erc1967_proxy
 )
 from app.utils.logger import logger
@@ -37,14 +40,10 @@ TEST_TOKEN_SUPPLY = 1000000  # 1 million tokens
 SELECTED_CHAINS = ["7001", "11155111"]  # ZetaChain Testnet and Sepolia
 TEST_WALLET = os.environ.get("TEST_WALLET_ADDRESS")  # Will fallback to deployer if not set
 
-async def test_single_chain_deployment(chain_id):
+async def test_single_chain_deployment(chain_id, web3, account):
     """Test web3 connection and contract validation on a single chain"""
     logger.info(f"Testing basic connection for chain {chain_id}...")
     
-    # Get Web3 instance and account
-    web3 = await get_web3(chain_id)
-    account = get_account()
-    
     if not web3 or not account:
         logger.error(f"Failed to get web3 or account for chain {chain_id}")
         return False
@@ -59,12 +58,22 @@ async def test_single_chain_deployment(chain_id):
         contract_abi = UNIVERSAL_TOKEN_ABI
         contract_bytecode = UNIVERSAL_TOKEN_BYTECODE
     
+    # Fetch gas price and balance in one JSON-RPC batch round-trip
+    try:
+        gas_price_hex, balance_hex = batch_rpc(web3, [
+            ("eth_gasPrice", []),
+            ("eth_getBalance", [account.address, "latest"])
+        ])
+        gas_price, balance = int(gas_price_hex, 16), int(balance_hex, 16)
+    except Exception as e:
+        logger.warning(f"JSON-RPC batch failed on chain {chain_id}, falling back to individual calls: {e}")
+        gas_price = web3.eth.gas_price
+        balance = web3.eth.get_balance(account.address)
+    
     # Display gas price
-    gas_price = web3.eth.gas_price
     logger.info(f"Current gas price on chain {chain_id}: {gas_price}")
     
     # Get current balance
-    balance = web3.eth.get_balance(account.address)
     logger.info(f"Account balance on chain {chain_id}: {web3.from_wei(balance, 'ether')} ETH")
     
     if balance == 0:
@@ -73,13 +82,12 @@ async def test_single_chain_deployment(chain_id):
     
     # Validate contract ABI contains key methods
     required_methods = ["initialize", "transferOwnership", "mint"]
-    for method in required_methods:
-        method_exists = any(entry.get('name') == method for entry in contract_abi if isinstance(entry, dict) and 'name' in entry)
-        if method_exists:
-            logger.info(f"Contract ABI contains required method: {method}")
-        else:
-            logger.error(f"Contract ABI missing required method: {method}")
-            return False
+    abi_names = {entry['name'] for entry in contract_abi if isinstance(entry, dict) and entry.get('name')}
+    missing = [method for method in required_methods if method not in abi_names]
+    if missing:
+        logger.error(f"Contract ABI missing required methods: {', '.join(missing)}")
+        return False
+    logger.info(f"Contract ABI contains required methods: {', '.join(required_methods)}")
     
     # Get chain configuration
     chain_config = get_chain_config(int(chain_id))
@@ -100,22 +108,19 @@ async def test_single_chain_deployment(chain_id):
     logger.info(f"Chain {chain_id} setup successful")
     return True
 
-async def test_deploy_contract_on_chain(chain_id):
+async def test_deploy_contract_on_chain(chain_id, web3, account):
     """Test contract deployment on a specific chain"""
     logger.info(f"Testing contract deployment on chain {chain_id}...")
     
-    # Get Web3 instance and account
-    web3 = await get_web3(int(chain_id))
-    account = get_account()
+    # Get chain configuration
+    chain_config = get_chain_config(int(chain_id))
+    gateway_address = chain_config.get("gateway_address")
     
     # Use appropriate ABI and bytecode based on chain
     if chain_id == "7001":  # ZetaChain
         contract_abi = ZC_UNIVERSAL_TOKEN_ABI
         contract_bytecode = ZC_UNIVERSAL_TOKEN_BYTECODE
         
-        # Get chain configuration
-        chain_config = get_chain_config(int(chain_id))
-        gateway_address = chain_config.get("gateway_address")
         uniswap_router_address = chain_config.get("uniswap_router_address")
         
         if not uniswap_router_address:
@@ -174,20 +179,25 @@ async def test_deploy_contract_on_chain(chain_id):
         contract_abi = UNIVERSAL_TOKEN_ABI
         contract_bytecode = UNIVERSAL_TOKEN_BYTECODE
         
-        # Get chain configuration
-        chain_config = get_chain_config(int(chain_id))
-        gateway_address = chain_config.get("gateway_address")
-        
-        # Deploy implementation
+        # Deploy the implementation at its CREATE2 address so every EVM chain (and
+        # every run) shares it; fall back to a plain deployment without the factory
         logger.info(f"Deploying EVM implementation contract on chain {chain_id}...")
-        impl_result = await deploy_implementation(
+        impl_result = await deploy_implementation_create2(
             web3=web3,
             account=account,
-            contract_abi=contract_abi,
             contract_bytecode=contract_bytecode,
-            constructor_args=None,
             gas_limit_override=5000000
         )
+        if not impl_result.get("success"):
+            logger.warning(f"CREATE2 deployment unavailable: {impl_result.get('message')}")
+            impl_result = await deploy_implementation(
+                web3=web3,
+                account=account,
+                contract_abi=contract_abi,
+                contract_bytecode=contract_bytecode,
+                constructor_args=None,
+                gas_limit_override=5000000
+            )
         
         if not impl_result.get("success"):
             logger.error(f"Failed to deploy EVM implementation: {impl_result.get('message')}")
@@ -240,8 +250,8 @@ async def test_deploy_contract_on_chain(chain_id):
         "timestamp": timestamp
     }
     
-    with open(f"deployment_{chain_id}_{timestamp}.json", "w") as f:
-        json.dump(deployment_info, f, indent=2)
+    async with aiofiles.open(f"deployment_{chain_id}_{timestamp}.json", "w") as f:
+        await f.write(json.dumps(deployment_info, indent=2))
     
     logger.info(f"Deployment info saved to deployment_{chain_id}_{timestamp}.json")
     return True
@@ -256,26 +266,43 @@ async def main():
         logger.error("Failed to load contract data")
         return False
     
+    # Connect to each chain and load the account once; every step below shares them
+    account = get_account()
+    web3s = dict(zip(SELECTED_CHAINS, await asyncio.gather(*(get_web3(int(chain_id)) for chain_id in SELECTED_CHAINS))))
+    if not account:
+        logger.error("Failed to load deployer account")
+        return False
+    
+    # Chains are independent, so probe and deploy them concurrently; each runs
+    # on its own thread/event loop since the web3 calls block
+    
     # Test basic chain connections first
     logger.info("Testing chain connections...")
-    for chain_id in SELECTED_CHAINS:
-        if not await test_single_chain_deployment(chain_id):
-            logger.error(f"Chain connection test failed for {chain_id}")
-            return False
+    connection_results = await asyncio.gather(
+        *(asyncio.to_thread(asyncio.run, test_single_chain_deployment(chain_id, web3s[chain_id], account)) for chain_id in SELECTED_CHAINS),
+        return_exceptions=True
+    )
+    for chain_id, result in zip(SELECTED_CHAINS, connection_results):
+        if result is not True:
+            logger.error(f"Chain connection test failed for {chain_id}: {result}")
+    if not all(result is True for result in connection_results):
+        return False
     
     # Deploy contracts on each chain
-    for chain_id in SELECTED_CHAINS:
-        logger.info(f"Starting deployment test on chain {chain_id}...")
-        try:
-            success = await test_deploy_contract_on_chain(chain_id)
-            if success:
-                logger.info(f"Deployment on chain {chain_id} successful!")
-            else:
-                logger.error(f"Deployment on chain {chain_id} failed!")
-                return False
-        except Exception as e:
-            logger.error(f"Exception during deployment on chain {chain_id}: {e}", exc_info=True)
-            return False
+    logger.info(f"Starting deployment tests on chains {', '.join(SELECTED_CHAINS)}...")
+    deployment_results = await asyncio.gather(
+        *(asyncio.to_thread(asyncio.run, test_deploy_contract_on_chain(chain_id, web3s[chain_id], account)) for chain_id in SELECTED_CHAINS),
+        return_exceptions=True
+    )
+    for chain_id, result in zip(SELECTED_CHAINS, deployment_results):
+        if isinstance(result, BaseException):
+            logger.error(f"Exception during deployment on chain {chain_id}: {result}", exc_info=result)
+        elif result:
+            logger.info(f"Deployment on chain {chain_id} successful!")
+        else:
+            logger.error(f"Deployment on chain {chain_id} failed!")
+    if not all(result is True for result in deployment_results):
+        return False
     
     logger.info("All deployment tests completed successfully!")
     return True
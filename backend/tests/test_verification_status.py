@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+"""Test caching of final contract verification statuses."""
+
+import pytest
+
+from app.utils import web3_helper
+
+
+class FakeResponse:
+    """Minimal stand-in for an httpx response."""
+
+    status_code = 200
+    text = ""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class FakeClient:
+    """Async httpx client stand-in that replays queued explorer responses."""
+
+    calls = 0
+    responses = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def get(self, url, params=None):
+        FakeClient.calls += 1
+        return FakeResponse(FakeClient.responses.pop(0))
+
+
+@pytest.mark.asyncio
+async def test_terminal_status_is_not_polled_again(monkeypatch):
+    """Once a GUID reaches a final status the explorer is not queried again."""
+    monkeypatch.setattr("httpx.AsyncClient", FakeClient)
+    monkeypatch.setattr(web3_helper, "_terminal_status", web3_helper.OrderedDict())
+    FakeClient.calls = 0
+    FakeClient.responses = [
+        {"status": "0", "result": "Pending in queue"},
+        {"status": "1", "result": "Pass"},
+    ]
+
+    pending = await web3_helper.check_verification_status("https://explorer.test", "guid-1")
+    assert pending["is_complete"] is False
+
+    for _ in range(3):
+        final = await web3_helper.check_verification_status("https://explorer.test", "guid-1")
+        assert final["success"] is True
+        assert final["is_complete"] is True
+
+    assert FakeClient.calls == 2
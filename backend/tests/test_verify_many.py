@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+"""Test concurrent contract verification via verify_many."""
+
+import asyncio
+import pytest
+
+from app.services import verification
+from app.utils import web3_helper
+
+
+@pytest.mark.asyncio
+async def test_verify_many_runs_submissions_concurrently(monkeypatch):
+    """Submissions overlap in time and every job keeps its own result."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_submission(**job):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if job["contract_name"] == "Broken":
+            raise RuntimeError("explorer unavailable")
+        return {"success": True, "error": False, "guid": f"guid-{job['contract_name']}"}
+
+    async def fake_status(explorer_base_url, guid, api_key="", is_blockscout=False):
+        return {"success": True, "error": False, "status": "Pass - Verified", "is_complete": True}
+
+    monkeypatch.setattr(web3_helper, "verify_contract_submission", fake_submission)
+    monkeypatch.setattr(web3_helper, "check_verification_status", fake_status)
+
+    jobs = [
+        {"explorer_base_url": "https://explorer.test", "contract_name": name, "contract_address": "0x0"}
+        for name in ("ZetaChainUniversalToken", "Broken", "EVMUniversalToken")
+    ]
+    results = await web3_helper.verify_many(jobs)
+
+    assert max_in_flight == len(jobs)
+    assert results[0]["status"] == "Pass - Verified"
+    assert results[0]["guid"] == "guid-ZetaChainUniversalToken"
+    assert results[1]["success"] is False
+    assert "explorer unavailable" in results[1]["message"]
+    assert results[2]["is_complete"] is True
+
+
+class FakeResponse:
+    """Minimal stand-in for an httpx response."""
+
+    status_code = 200
+    text = ""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class RecordingClient:
+    """Async httpx client stand-in that records when each verification request starts and ends."""
+
+    events = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def post(self, url, data=None):
+        RecordingClient.events.append(("start", url))
+        await asyncio.sleep(0.01)
+        RecordingClient.events.append(("end", url))
+        return FakeResponse({"status": "1", "message": f"guid-{data['addressHash']}"})
+
+
+@pytest.mark.asyncio
+async def test_service_submits_contracts_concurrently(monkeypatch, tmp_path):
+    """VerificationService sends every chain's request before any of them completes."""
+    for name in ("ZetaChainUniversalToken", "EVMUniversalToken"):
+        (tmp_path / f"{name}.sol").write_text("pragma solidity 0.8.26;\ncontract C {}\n")
+    monkeypatch.setattr(verification, "CONTRACTS_SOURCE_DIR", str(tmp_path))
+    monkeypatch.setattr("httpx.AsyncClient", RecordingClient)
+    RecordingClient.events = []
+
+    results = await verification.verification_service.verify_contracts([
+        {"contract_address": "0x01", "chain_id": "7001", "contract_type": "zetachain"},
+        {"contract_address": "0x02", "chain_id": "11155111", "contract_type": "evm"},
+    ])
+
+    assert [kind for kind, _ in RecordingClient.events] == ["start", "start", "end", "end"]
+    assert [result["status"] for result in results] == ["success", "success"]
+    assert results[0]["guid"] == "guid-0x01"